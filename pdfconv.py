@@ -1,14 +1,22 @@
 import os
 import re
+import array
 import sys
 import shutil
-import difflib
+import itertools
+import logging
 import tempfile
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import fitz  # PyMuPDF
 from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import qn
 import tkinter as tk
 from tkinter import filedialog as fd
 
+log = logging.getLogger(__name__)
+
 try:
     from docx2pdf import convert as docx2pdf_convert
 except Exception:
@@ -16,19 +24,34 @@ except Exception:
 
 try:
     import win32com.client as win32
+    import pythoncom
 except Exception:
     win32 = None
+    pythoncom = None
+
+try:
+    # Linear-time matching for the placeholder scan when google-re2 is installed
+    import re2 as _placeholder_re
+except Exception:
+    _placeholder_re = re
 
 RADIO_HANDLING = 'fallback'  # options: 'fallback' | 'skip' | 'strict'
-PLACEHOLDER_PATTERN = re.compile(
-    r'(?:\{\{)?\s*('
-    r'(?:textbox|multilinetextfield|radiobutton|checkbox|combobox|'
-    r'listbox|pushbutton|submitbutton|resetbutton|imagebutton|datefield|'
-    r'timefield|datetimefield|signaturefield|barcodefield|qrcodefield|'
-    r'pdf417field|code128field|numericfield|decimalfield|currencyfield|'
-    r'percentfield|emailfield|phonefield)'
-    r':[A-Za-z0-9_\-]+(?:\|[^{}|]+)*)\s*(?:\}\})?',
-    re.IGNORECASE,
+# Below this many pages the worker start-up cost outweighs a parallel placeholder scan
+PARALLEL_SCAN_MIN_PAGES = 8
+PLACEHOLDER_TYPES = (
+    'textbox', 'multilinetextfield', 'radiobutton', 'checkbox', 'combobox',
+    'listbox', 'pushbutton', 'submitbutton', 'resetbutton', 'imagebutton', 'datefield',
+    'timefield', 'datetimefield', 'signaturefield', 'barcodefield', 'qrcodefield',
+    'pdf417field', 'code128field', 'numericfield', 'decimalfield', 'currencyfield',
+    'percentfield', 'emailfield', 'phonefield',
+)
+# Every placeholder type ends in one of these; pages without any of them cannot match
+_PLACEHOLDER_TYPE_SUFFIXES = ('box', 'field', 'button')
+# Longest alternatives first so the engine never has to back out of a shorter prefix
+PLACEHOLDER_PATTERN = _placeholder_re.compile(
+    r'(?i)(?:\{\{)?\s*('
+    r'(?:' + '|'.join(sorted(PLACEHOLDER_TYPES, key=len, reverse=True)) + r')'
+    r':[A-Za-z0-9_\-]+(?:\|[^{}|]+)*)\s*(?:\}\})?'
 )
 # Option keys we try to recover even if Word mangled the separator
 OPTION_KEYWORDS = (
@@ -63,6 +86,52 @@ NUMERIC_OPTION_KEYS = {
 }
 TEXT_OPTION_KEYS = {'value', 'default', 'label', 'tooltip', 'data', 'url'}
 SCRIPT_OPTION_KEYS = {'calculation', 'validation'}
+# Options that override the field's size (suppress fitting to the table cell)
+_DIM_KEYS = frozenset({'rowheight', 'cellwidth', 'columnwidth', 'width', 'height'})
+# Single alternation over every option key so a token is scanned once. Longer keys
+# come first so 'rowheight:' is not split into 'row|height:'.
+_OPTION_KEYS_RE = re.compile(
+    '(' + '|'.join(map(re.escape, sorted(OPTION_KEYWORDS, key=len, reverse=True))) + '):',
+    re.IGNORECASE,
+)
+_DOUBLE_PIPE_RE = re.compile(r'\|{2,}')
+# Patterns used while cleaning/parsing every placeholder, compiled once
+_SPACED_OPEN = re.compile(r'\{\s*\{')
+_SPACED_CLOSE = re.compile(r'\}\s*\}')
+_INSIDE_COLON = re.compile(r'\s*:\s*')
+_INSIDE_PIPE = re.compile(r'\s*\|\s*')
+_PLACEHOLDER_BLOCK = re.compile(r'\{\{(.*?)\}\}')
+_FIELD_NAME_RE = re.compile(r'([A-Za-z0-9_\-]+)(.*)')
+_LEADING_NON_ALNUM = re.compile(r'^[^a-z0-9]+')
+_TRAILING_NON_ALNUM = re.compile(r'[^a-z0-9]+$')
+_EXPORT_VALUE_JUNK = re.compile(r'[^0-9A-Za-z]+')
+_UNIT_SUFFIX_RE = re.compile(r'(?:pt|px|mm|cm|in)$', re.IGNORECASE)
+
+
+def _build_option_key_fixups():
+    """
+    Enumerate the single-character corruptions Word/OCR tends to introduce in
+    option keys (stray leading 'I'/'l', dropped, swapped or substituted letters)
+    and map each one back to its keyword. Exact keywords always win.
+    """
+    alphabet = 'abcdefghijklmnopqrstuvwxyz0123456789'
+    fixups = {key: key for key in OPTION_KEYWORDS}
+    for key in OPTION_KEYWORDS:
+        variants = [prefix + key for prefix in ('i', 'l', '1', 'j')]
+        for i in range(len(key) + 1):
+            head, tail = key[:i], key[i:]
+            variants.extend(head + ch + tail for ch in alphabet)
+            if tail:
+                variants.append(head + tail[1:])
+                variants.extend(head + ch + tail[1:] for ch in alphabet)
+            if len(tail) > 1:
+                variants.append(head + tail[1] + tail[0] + tail[2:])
+        for variant in variants:
+            fixups.setdefault(variant, key)
+    return fixups
+
+
+_OPTION_KEY_FIXUPS = _build_option_key_fixups()
 
 # Characters Word often injects while wrapping long tokens. They break placeholder
 # detection if we do not strip them out beforehand.
@@ -77,6 +146,11 @@ _INVISIBLE_CHAR_CODES = (
     0xFEFF,  # zero-width no-break space / BOM
 )
 _INVISIBLE_CHAR_MAP = {code: None for code in _INVISIBLE_CHAR_CODES}
+_INVISIBLE_ANY_RE = re.compile('[' + ''.join(chr(code) for code in _INVISIBLE_CHAR_CODES) + ']')
+# str.translate tables for dropping whitespace (the same characters regex \s matches;
+# all of them sit below U+3001) with or without the invisible characters above.
+_WS_TRANSLATE = {code: None for code in range(0x3001) if chr(code).isspace()}
+_INVISIBLE_AND_WS_TRANSLATE = {**_INVISIBLE_CHAR_MAP, **_WS_TRANSLATE}
 
 
 def strip_invisible(text):
@@ -85,7 +159,8 @@ def strip_invisible(text):
     placeholder wraps mid-word. These characters are not whitespace, so regex
     matching would otherwise fail.
     """
-    if not text:
+    # Most spans contain none of these; the regex probe avoids rebuilding the string
+    if not text or not _INVISIBLE_ANY_RE.search(text):
         return text
     return text.translate(_INVISIBLE_CHAR_MAP)
 
@@ -126,6 +201,47 @@ def render_docx_to_pdf(docx_path):
 
     return temp_pdf, temp_dir
 
+
+def _render_docx_in_thread(docx_path):
+    """
+    render_docx_to_pdf for a worker thread: Word automation (used by docx2pdf on
+    Windows and by the COM fallback) needs COM initialised on the calling thread.
+    """
+    if pythoncom is None:
+        return render_docx_to_pdf(docx_path)
+    pythoncom.CoInitialize()
+    try:
+        return render_docx_to_pdf(docx_path)
+    finally:
+        pythoncom.CoUninitialize()
+
+
+# WordprocessingML parts that can carry visible text: the body (with its tables and
+# text boxes), headers, footers, footnotes, endnotes and comments
+_DOCX_TEXT_PART_SUFFIXES = ('.main+xml', '.header+xml', '.footer+xml', '.footnotes+xml', '.endnotes+xml', '.comments+xml')
+
+
+def find_docx_placeholders(docx_path):
+    """
+    Catalogue placeholder tokens straight from the DOCX XML without rendering the
+    document. The text of each part is joined and cleaned the same way as the PDF
+    page text, so placeholders Word split across runs or paragraphs are still found.
+    Returns a list of normalized placeholder strings, part by part.
+    """
+    document = Document(docx_path)
+    placeholders = []
+    for part in document.part.package.iter_parts():
+        if not part.content_type.endswith(_DOCX_TEXT_PART_SUFFIXES):
+            continue
+        root = getattr(part, 'element', None)
+        if root is None:
+            root = parse_xml(part.blob)
+        text = ''.join(t.text or '' for t in root.iter(qn('w:t')))
+        text = text.translate(_INVISIBLE_AND_WS_TRANSLATE)
+        for match in PLACEHOLDER_PATTERN.finditer(text):
+            placeholders.append(normalize_placeholder_token(match.group(1)))
+    return placeholders
+
 # Use local fallbacks for constants instead of mutating fitz
 BTN_PUSH = getattr(fitz, 'PDF_BTN_TYPE_PUSHBUTTON', 0)
 BTN_SUBMIT = getattr(fitz, 'PDF_BTN_TYPE_SUBMIT', 1)
@@ -135,11 +251,32 @@ FIELD_IS_READONLY = getattr(fitz, 'PDF_FIELD_IS_READONLY', 1)
 CH_FIELD_IS_MULTISELECT = getattr(fitz, 'PDF_CH_FIELD_IS_MULTISELECT', (1 << 21))
 FIELD_IS_REQUIRED = getattr(fitz, 'PDF_FIELD_IS_REQUIRED', (1 << 1))
 SIG_FLAG_DIGITAL = getattr(fitz, 'PDF_SIG_FLAG_DIGITAL', 1)
+TX_FIELD_IS_MULTILINE = getattr(fitz, 'PDF_TX_FIELD_IS_MULTILINE', (1 << 12))
+TX_FIELD_IS_RICH_TEXT = getattr(fitz, 'PDF_TX_FIELD_IS_RICH_TEXT', (1 << 25))
+TX_FIELD_IS_PASSWORD = getattr(fitz, 'PDF_TX_FIELD_IS_PASSWORD', (1 << 13))
+TX_FIELD_IS_DONOTSCROLL = getattr(fitz, 'PDF_TX_FIELD_IS_DONOTSCROLL', (1 << 23))
+# PDF defines no field-level hidden flag and PyMuPDF does not export one; add nothing by default
+FIELD_IS_HIDDEN = getattr(fitz, 'PDF_FIELD_IS_HIDDEN', 0)
+REDACT_IMAGE_NONE = getattr(fitz, 'PDF_REDACT_IMAGE_NONE', 0)
+
+# Extra field flags for text field variants, keyed by placeholder type
+_TEXT_FIELD_FLAGS = {
+    'multilinetextfield': TX_FIELD_IS_MULTILINE,
+    'richtextfield': TX_FIELD_IS_MULTILINE | TX_FIELD_IS_RICH_TEXT,
+    'passwordfield': TX_FIELD_IS_PASSWORD,
+    'hiddenfield': FIELD_IS_HIDDEN,
+}
+
+# Widget types bound once so per-field code avoids repeated fitz attribute lookups
+WIDGET_TEXT = getattr(fitz, 'PDF_WIDGET_TYPE_TEXT', 7)
+WIDGET_CHECKBOX = getattr(fitz, 'PDF_WIDGET_TYPE_CHECKBOX', 2)
+WIDGET_RADIOBUTTON = getattr(fitz, 'PDF_WIDGET_TYPE_RADIOBUTTON', 5)
+WIDGET_COMBOBOX = getattr(fitz, 'PDF_WIDGET_TYPE_COMBOBOX', 3)
+WIDGET_LISTBOX = getattr(fitz, 'PDF_WIDGET_TYPE_LISTBOX', 4)
+WIDGET_BUTTON = getattr(fitz, 'PDF_WIDGET_TYPE_BUTTON', 1)
+WIDGET_SIGNATURE = getattr(fitz, 'PDF_WIDGET_TYPE_SIGNATURE', 6)
+
 
-# Track created radio parents per document so we can link radio options into groups.
-RADIO_PARENTS = {}
-# Keep richer metadata so we can repair broken groups or mismatched On-states
-RADIO_GROUPS = {}
 def _normalize_export_value(value):
     """
     Convert raw placeholder radio/checkbox values into Acrobat-friendly tokens.
@@ -147,50 +284,31 @@ def _normalize_export_value(value):
     """
     if not value:
         return 'Yes'
-    cleaned = re.sub(r'[^0-9A-Za-z]+', '', value)
+    cleaned = _EXPORT_VALUE_JUNK.sub('', value)
     if not cleaned:
         return 'Yes'
     # Title-case keeps readability while remaining deterministic
     return cleaned[0].upper() + cleaned[1:]
 
 
-def _apply_radio_parent(field_name, widget):
+def _norm_state_name(name):
     """
-    Ensure that radio widgets sharing the same field_name point at a common parent.
-    PyMuPDF models radio groups by linking members to the first widget's xref.
+    Normalize button state names for comparison (strip slashes, underscores, case).
     """
-    if widget is None:
-        return
-    if field_name not in RADIO_GROUPS:
-        RADIO_GROUPS[field_name] = {'parent': None, 'widgets': []}
-    group = RADIO_GROUPS[field_name]
-    group['widgets'].append(widget)
-    if group['parent'] is None and getattr(widget, 'xref', None):
-        group['parent'] = widget.xref
-    parent = group['parent']
-    if parent is None:
-        return
-    # First widget uses itself as parent; all others re-point to the stored parent.
-    try:
-        widget.rb_parent = parent
-        widget.update()
-    except Exception:
-        pass
+    if name is None:
+        return None
+    return str(name).strip().lower().lstrip('/').replace('_', '')
 
 
 def _ensure_radio_state(widget, export_value):
     """
     Ensure the radio widget exposes an On-state matching the requested export value.
     Without this Acrobat will refuse to toggle specific options (e.g., 'No').
+    The caller is responsible for calling widget.update() afterwards.
     """
     if widget is None:
         return
-    normalized = _normalize_export_value(export_value)
-    try:
-        widget.button_caption = normalized
-        widget.update()
-    except Exception:
-        pass
+    widget.button_caption = _normalize_export_value(export_value)
 
 
 def _build_length_guard(limit):
@@ -211,34 +329,70 @@ if (!event.willCommit) {{
 """.strip()
     return guard
 
+# Keystroke validation scripts for fields checked with a JS regex
+# Basic email validation script
+_EMAIL_VALIDATION_JS = 'event.rc = /^\\S+@\\S+\\.\\S+$/.test(event.value) || event.value == "";'
+# Basic phone validation (adjust as needed)
+_PHONE_VALIDATION_JS = 'event.rc = /^\\d{10}$/.test(event.value.replace(/\\D/g, "")) || event.value == "";'
+# Acrobat (format, keystroke) script pairs applied by field type; a None format
+# means the field only carries a validation script
+_FIELD_SCRIPTS = {
+    'datefield': ('AFDate_FormatEx("yyyy-mm-dd");', 'AFDate_KeystrokeEx("yyyy-mm-dd");'),
+    'date': ('AFDate_FormatEx("yyyy-mm-dd");', 'AFDate_KeystrokeEx("yyyy-mm-dd");'),
+    'timefield': ('AFTime_FormatEx("HH:MM");', 'AFTime_KeystrokeEx("HH:MM");'),
+    'datetimefield': ('AFDate_FormatEx("yyyy-mm-dd HH:MM");', 'AFDate_KeystrokeEx("yyyy-mm-dd HH:MM");'),
+    'numericfield': ('AFNumber_Format(0, 0, 0, 0, "", false);', 'AFNumber_Keystroke(0, 0, 0, 0, "", false);'),
+    'numberfield': ('AFNumber_Format(0, 0, 0, 0, "", false);', 'AFNumber_Keystroke(0, 0, 0, 0, "", false);'),
+    'decimalfield': ('AFNumber_Format(2, 0, 0, 0, "", false);', 'AFNumber_Keystroke(2, 0, 0, 0, "", false);'),
+    'currencyfield': ('AFNumber_Format(2, 0, 0, 0, "$", false);', 'AFNumber_Keystroke(2, 0, 0, 0, "$", false);'),
+    'percentfield': ('AFPercent_Format(2, 0, 0, 0, "", false);', 'AFPercent_Keystroke(2, 0, 0, 0, "", false);'),
+    'emailfield': (None, _EMAIL_VALIDATION_JS),
+    'phonefield': (None, _PHONE_VALIDATION_JS),
+}
+# The same scripts selected by an explicit format:<name> option on a text field
+_FORMAT_SCRIPTS = {
+    'date': _FIELD_SCRIPTS['datefield'],
+    'number': _FIELD_SCRIPTS['numberfield'],
+    'currency': _FIELD_SCRIPTS['currencyfield'],
+    'percent': _FIELD_SCRIPTS['percentfield'],
+    'email': _FIELD_SCRIPTS['emailfield'],
+    'phone': _FIELD_SCRIPTS['phonefield'],
+}
+
 # Default border colors and widths (RGB tuples and floats)
 REQUIRED_BORDER_COLOR = (1.0, 0.0, 0.0)
 DEFAULT_BORDER_COLOR = (0.0, 0.5, 1.0)
 REQUIRED_BORDER_WIDTH = 1.0
 DEFAULT_BORDER_WIDTH = 0.6
 
+# Signature widgets should not display text, but PyMuPDF validation expects the text
+# properties to exist, so they are reset to these values instead of being removed.
+_SIG_TEXT_DEFAULTS = (('text_font', None), ('text_fontsize', None), ('text_color', (0, 0, 0)))
+# Before insertion the widget also drops any default value
+_SIG_DEFAULTS = _SIG_TEXT_DEFAULTS + (('field_value', None),)
+
 def clean_placeholder_text(text):
     """
     Clean spaces in placeholder strings to handle Word conversion artifacts.
     """
     text = strip_invisible(text)
     # First, fix spaced brackets
-    text = re.sub(r'\{\s*\{', '{{', text)
-    text = re.sub(r'\}\s*\}', '}}', text)
+    text = _SPACED_OPEN.sub('{{', text)
+    text = _SPACED_CLOSE.sub('}}', text)
     
     # Then clean inside placeholders
     def clean_inside(match):
         inside = match.group(1)
         # Remove all whitespace (spaces, newlines, etc.)
-        inside = re.sub(r'\s+', '', inside)
+        inside = inside.translate(_WS_TRANSLATE)
         # Remove spaces around colons and pipes (though spaces are removed, keep for consistency)
-        inside = re.sub(r'\s*:\s*', ':', inside)
-        inside = re.sub(r'\s*\|\s*', '|', inside)
+        inside = _INSIDE_COLON.sub(':', inside)
+        inside = _INSIDE_PIPE.sub('|', inside)
         return '{{' + inside + '}}'
     
     # Split merged placeholders like '}}{{' so they become separate tokens
     text = text.replace('}}{{', '}} {{')
-    text = re.sub(r'\{\{(.*?)\}\}', clean_inside, text)
+    text = _PLACEHOLDER_BLOCK.sub(clean_inside, text)
     return text
 
 
@@ -251,24 +405,22 @@ def normalize_placeholder_token(token):
         return token
     token = strip_invisible(token)
     token = token.strip().strip('{}[]()')
-    token = re.sub(r'\s+', '', token)
+    token = token.translate(_WS_TRANSLATE)
 
-    def _prefix_option(match, key):
+    def _prefix_option(match):
         start = match.start()
         prev = match.string[start - 1] if start > 0 else ''
-        normalized = f"{key}:"
+        normalized = f"{match.group(1).lower()}:"
         if prev in ('|', ':'):
             return normalized
         if start == 0:
             return normalized
         return f"|{normalized}"
 
-    for key in OPTION_KEYWORDS:
-        pattern = re.compile(rf'(?i){key}:')
-        token = pattern.sub(lambda m, _key=key: _prefix_option(m, _key), token)
+    token = _OPTION_KEYS_RE.sub(_prefix_option, token)
 
     # Trim doubled separators that may have been introduced
-    token = re.sub(r'\|{2,}', '|', token)
+    token = _DOUBLE_PIPE_RE.sub('|', token)
     # Remove trailing punctuation that survived the cleanup
     token = token.strip('|').strip()
     return token
@@ -283,17 +435,14 @@ def normalize_option_key(key):
     base = strip_invisible(key).lower().strip()
     if base in OPTION_KEYWORDS:
         return base
-    base = re.sub(r'^[^a-z0-9]+', '', base)
-    base = re.sub(r'[^a-z0-9]+$', '', base)
+    base = _LEADING_NON_ALNUM.sub('', base)
+    base = _TRAILING_NON_ALNUM.sub('', base)
     if base in OPTION_KEYWORDS:
         return base
-    for prefix in ('i', 'l', '1', 'j'):
-        if base.startswith(prefix) and base[len(prefix):] in OPTION_KEYWORDS:
-            return base[len(prefix):]
-    match = difflib.get_close_matches(base, OPTION_KEYWORDS, n=1, cutoff=0.72)
-    if match:
-        return match[0]
-    return base
+    fixed = _OPTION_KEY_FIXUPS.get(base)
+    if fixed is None and base[:1] in ('i', 'l', '1', 'j'):
+        fixed = _OPTION_KEY_FIXUPS.get(base[1:])
+    return fixed or base
 
 def parse_placeholder(placeholder):
     """
@@ -301,13 +450,12 @@ def parse_placeholder(placeholder):
     Returns: field_type_str, field_name, is_required, is_readonly, options_dict
     """
     placeholder = normalize_placeholder_token(placeholder)
-    parts = placeholder.split(':')
-    if len(parts) < 2:
+    head, sep, rest = placeholder.partition(':')
+    if not sep:
         raise ValueError(f"Invalid placeholder format: {placeholder}")
     
-    field_type_str = parts[0].lower()
-    rest = ':'.join(parts[1:])
-    match_name = re.match(r'([A-Za-z0-9_\-]+)(.*)', rest)
+    field_type_str = head.lower()
+    match_name = _FIELD_NAME_RE.match(rest)
     if not match_name:
         raise ValueError(f"Invalid placeholder format: {placeholder}")
     field_name = match_name.group(1)
@@ -315,148 +463,184 @@ def parse_placeholder(placeholder):
     tail = tail or ''
     if tail and not tail.startswith('|'):
         tail = '|' + tail
-    raw_subparts = [field_name] + [p.strip() for p in tail.split('|') if p.strip()]
-    subparts = []
-    for sub in raw_subparts:
-        cleaned = sub.strip().strip(')}]')
-        cleaned = cleaned.strip()
+    # Remove whitespace (including newlines) that may be introduced by Word line breaks
+    field_name = field_name.translate(_WS_TRANSLATE)
+    subparts = [field_name]
+    for sub in tail.split('|'):
+        cleaned = sub.strip().strip(')}]').strip()
         if cleaned:
             subparts.append(cleaned)
+    subparts_lower = {s.lower() for s in subparts}
+    is_required = 'required' in subparts_lower
+    is_readonly = 'readonly' in subparts_lower
     
-    # Remove whitespace (including newlines) that may be introduced by Word line breaks
-    field_name = re.sub(r'\s+', '', field_name)
-    subparts[0] = field_name
-    is_required = 'required' in [s.lower() for s in subparts]
-    is_readonly = 'readonly' in [s.lower() for s in subparts]
-    
-    # Parse additional options like options:a,b,c
+    # Parse additional options like options:a,b,c (keys are lowercased by normalize_option_key)
     options_dict = {}
     for sub in subparts[1:]:
-        if ':' in sub:
-            key, value = sub.split(':', 1)
+        key, sep, value = sub.partition(':')
+        if sep:
             key = normalize_option_key(key.strip().strip(')}]'))
             if not key:
                 continue
             value = value.strip().strip(')}]')
             if key == 'options':
-                clean_value = re.sub(r'\s+', '', value)
+                clean_value = value.translate(_WS_TRANSLATE)
             elif key in NUMERIC_OPTION_KEYS:
-                numeric_value = value.replace(',', '.')
-                clean_value = re.sub(r'\s+', '', numeric_value)
+                # Drop a trailing unit such as 'pt' so float() accepts the value
+                numeric_value = _UNIT_SUFFIX_RE.sub('', value).replace(',', '.')
+                clean_value = numeric_value.translate(_WS_TRANSLATE)
+                try:
+                    float(clean_value)
+                except ValueError:
+                    log.warning("Ignoring option %s:%s, expected a number", key, value)
+                    continue
             elif key in TEXT_OPTION_KEYS:
                 clean_value = ' '.join(value.split())
             elif key in SCRIPT_OPTION_KEYS:
                 clean_value = value.strip()
             else:
-                clean_value = re.sub(r'\s+', '', value)
+                clean_value = value.translate(_WS_TRANSLATE)
             options_dict[key] = clean_value
     
     return field_type_str, field_name, is_required, is_readonly, options_dict
 
+# Placeholder type -> PyMuPDF widget type, built once at import
+_FIELD_TYPE_MAP = {
+    # Text Fields
+    'textfield': WIDGET_TEXT,
+    'textbox': WIDGET_TEXT,
+    'multilinetextfield': WIDGET_TEXT,
+    'passwordfield': WIDGET_TEXT,
+    'numericfield': WIDGET_TEXT,
+    'decimalfield': WIDGET_TEXT,
+    'numberfield': WIDGET_TEXT,
+    'currencyfield': WIDGET_TEXT,
+    'percentfield': WIDGET_TEXT,
+    'datefield': WIDGET_TEXT,
+    'timefield': WIDGET_TEXT,
+    'datetimefield': WIDGET_TEXT,
+    'emailfield': WIDGET_TEXT,
+    'phonefield': WIDGET_TEXT,
+    'richtextfield': WIDGET_TEXT,
+    'calculatedfield': WIDGET_TEXT,
+    'validationfield': WIDGET_TEXT,
+    'hiddenfield': WIDGET_TEXT,
+    'readonlyfield': WIDGET_TEXT,
+    'requiredfieldattribute': WIDGET_TEXT,
+    'tooltipfieldattribute': WIDGET_TEXT,
+
+    # Choice Fields
+    'checkbox': WIDGET_CHECKBOX,
+    'radiobutton': WIDGET_RADIOBUTTON,
+    'combobox': WIDGET_COMBOBOX,
+    'listbox': WIDGET_LISTBOX,
+    'dropdownlist': WIDGET_COMBOBOX,
+
+    # Button Fields
+    'pushbutton': WIDGET_BUTTON,
+    'submitbutton': WIDGET_BUTTON,
+    'resetbutton': WIDGET_BUTTON,
+    'imagebutton': WIDGET_BUTTON,
+    'imagefield': WIDGET_BUTTON,
+
+    # Signature Fields
+    'signaturefield': WIDGET_SIGNATURE,
+    'digitalsignaturefield': WIDGET_SIGNATURE,
+
+    # Other Fields (mapped to text or button)
+    'fileattachmentfield': WIDGET_BUTTON,
+    'barcodefield': WIDGET_TEXT,
+    'qrcodefield': WIDGET_TEXT,
+    'pdf417field': WIDGET_TEXT,
+    'code128field': WIDGET_TEXT,
+
+    # Annotations (not form fields, but mapped for compatibility)
+    'annotationwidget': WIDGET_TEXT,
+    'freetextannotation': WIDGET_TEXT,
+    'inkannotation': WIDGET_TEXT,
+    'stampannotation': WIDGET_TEXT,
+    'popupannotation': WIDGET_TEXT,
+    'soundannotation': WIDGET_TEXT,
+    'movieannotation': WIDGET_TEXT,
+    'screenannotation': WIDGET_TEXT,
+    'lineannotation': WIDGET_TEXT,
+    'squareannotation': WIDGET_TEXT,
+    'circleannotation': WIDGET_TEXT,
+    'polygonannotation': WIDGET_TEXT,
+    'polylineannotation': WIDGET_TEXT,
+    'fileattachmentannotation': WIDGET_TEXT,
+    'widgetannotation': WIDGET_TEXT,
+
+    # XFA Fields (not fully supported, mapped to closest)
+    'subformfield': WIDGET_TEXT,
+    'drawfield': WIDGET_TEXT,
+    'numericupdownfield': WIDGET_TEXT,
+    'validationgroup': WIDGET_TEXT,
+
+    # Legacy
+    'date': WIDGET_TEXT,
+}
+
+
 def get_field_type(field_type_str):
     """
     Map string to PyMuPDF widget type
     Supports common Adobe PDF form fields.
     """
-    type_map = {
-        # Text Fields
-        'textfield': fitz.PDF_WIDGET_TYPE_TEXT,
-        'textbox': fitz.PDF_WIDGET_TYPE_TEXT,
-        'multilinetextfield': fitz.PDF_WIDGET_TYPE_TEXT,
-        'passwordfield': fitz.PDF_WIDGET_TYPE_TEXT,
-        'numericfield': fitz.PDF_WIDGET_TYPE_TEXT,
-        'decimalfield': fitz.PDF_WIDGET_TYPE_TEXT,
-        'numberfield': fitz.PDF_WIDGET_TYPE_TEXT,
-        'currencyfield': fitz.PDF_WIDGET_TYPE_TEXT,
-        'percentfield': fitz.PDF_WIDGET_TYPE_TEXT,
-        'datefield': fitz.PDF_WIDGET_TYPE_TEXT,
-        'timefield': fitz.PDF_WIDGET_TYPE_TEXT,
-        'datetimefield': fitz.PDF_WIDGET_TYPE_TEXT,
-        'emailfield': fitz.PDF_WIDGET_TYPE_TEXT,
-        'phonefield': fitz.PDF_WIDGET_TYPE_TEXT,
-        'richtextfield': fitz.PDF_WIDGET_TYPE_TEXT,
-        'calculatedfield': fitz.PDF_WIDGET_TYPE_TEXT,
-        'validationfield': fitz.PDF_WIDGET_TYPE_TEXT,
-        'hiddenfield': fitz.PDF_WIDGET_TYPE_TEXT,
-        'readonlyfield': fitz.PDF_WIDGET_TYPE_TEXT,
-        'requiredfieldattribute': fitz.PDF_WIDGET_TYPE_TEXT,
-        'tooltipfieldattribute': fitz.PDF_WIDGET_TYPE_TEXT,
-        
-        # Choice Fields
-        'checkbox': fitz.PDF_WIDGET_TYPE_CHECKBOX,
-        'radiobutton': fitz.PDF_WIDGET_TYPE_RADIOBUTTON,
-        'combobox': fitz.PDF_WIDGET_TYPE_COMBOBOX,
-        'listbox': fitz.PDF_WIDGET_TYPE_LISTBOX,
-        'dropdownlist': fitz.PDF_WIDGET_TYPE_COMBOBOX,
-        
-        # Button Fields
-        'pushbutton': fitz.PDF_WIDGET_TYPE_BUTTON,
-        'submitbutton': fitz.PDF_WIDGET_TYPE_BUTTON,
-        'resetbutton': fitz.PDF_WIDGET_TYPE_BUTTON,
-        'imagebutton': fitz.PDF_WIDGET_TYPE_BUTTON,
-        'imagefield': fitz.PDF_WIDGET_TYPE_BUTTON,
-        
-        # Signature Fields
-        'signaturefield': fitz.PDF_WIDGET_TYPE_SIGNATURE,
-        'digitalsignaturefield': fitz.PDF_WIDGET_TYPE_SIGNATURE,
-        
-        # Other Fields (mapped to text or button)
-        'fileattachmentfield': fitz.PDF_WIDGET_TYPE_BUTTON,
-        'barcodefield': fitz.PDF_WIDGET_TYPE_TEXT,
-        'qrcodefield': fitz.PDF_WIDGET_TYPE_TEXT,
-        'pdf417field': fitz.PDF_WIDGET_TYPE_TEXT,
-        'code128field': fitz.PDF_WIDGET_TYPE_TEXT,
-        
-        # Annotations (not form fields, but mapped for compatibility)
-        'annotationwidget': fitz.PDF_WIDGET_TYPE_TEXT,
-        'freetextannotation': fitz.PDF_WIDGET_TYPE_TEXT,
-        'inkannotation': fitz.PDF_WIDGET_TYPE_TEXT,
-        'stampannotation': fitz.PDF_WIDGET_TYPE_TEXT,
-        'popupannotation': fitz.PDF_WIDGET_TYPE_TEXT,
-        'soundannotation': fitz.PDF_WIDGET_TYPE_TEXT,
-        'movieannotation': fitz.PDF_WIDGET_TYPE_TEXT,
-        'screenannotation': fitz.PDF_WIDGET_TYPE_TEXT,
-        'lineannotation': fitz.PDF_WIDGET_TYPE_TEXT,
-        'squareannotation': fitz.PDF_WIDGET_TYPE_TEXT,
-        'circleannotation': fitz.PDF_WIDGET_TYPE_TEXT,
-        'polygonannotation': fitz.PDF_WIDGET_TYPE_TEXT,
-        'polylineannotation': fitz.PDF_WIDGET_TYPE_TEXT,
-        'fileattachmentannotation': fitz.PDF_WIDGET_TYPE_TEXT,
-        'widgetannotation': fitz.PDF_WIDGET_TYPE_TEXT,
-        
-        # XFA Fields (not fully supported, mapped to closest)
-        'subformfield': fitz.PDF_WIDGET_TYPE_TEXT,
-        'drawfield': fitz.PDF_WIDGET_TYPE_TEXT,
-        'decimalfield': fitz.PDF_WIDGET_TYPE_TEXT,  # XFA
-        'numericupdownfield': fitz.PDF_WIDGET_TYPE_TEXT,
-        'barcodefield': fitz.PDF_WIDGET_TYPE_TEXT,  # XFA
-        'validationgroup': fitz.PDF_WIDGET_TYPE_TEXT,
-        
-        # Legacy
-        'date': fitz.PDF_WIDGET_TYPE_TEXT,
-    }
-    return type_map.get(field_type_str, fitz.PDF_WIDGET_TYPE_TEXT)
+    return _FIELD_TYPE_MAP.get(field_type_str, WIDGET_TEXT)
 
-def get_font_info(page, rect, search_text=None):
+def build_page_font_index(page):
     """
-    Extract font name, size, and color for the placeholder text.
-    Returns: font_name, font_size, text_color (as tuple)
+    Collect (font, size, color) for every visible span of the page together with
+    a y_bucket map from integer y coordinates to the spans covering them, so font
+    lookups only test spans near the placeholder.
+    Spans are stored as plain (stripped text, x0, y0, x1, y1) tuples.
     """
     text_dict = page.get_text("dict")
+    spans = []
+    font_by_span_idx = []
+    y_bucket = {}
     for block in text_dict.get('blocks', []):
         for line in block.get('lines', []):
             for span in line.get('spans', []):
-                span_text = span.get('text', '').strip()
-                span_bbox = fitz.Rect(span['bbox'])
-                if span_bbox.intersects(rect) and (search_text is None or search_text in span_text):
-                    font_name = span.get('font', 'Helvetica')
-                    font_size = span.get('size', 12.0)
-                    color = span.get('color', 0)
-                    r = (color >> 16) & 0xFF
-                    g = (color >> 8) & 0xFF
-                    b = color & 0xFF
-                    text_color = (r / 255.0, g / 255.0, b / 255.0)
-                    return font_name, font_size, text_color
+                text = span.get('text', '')
+                if not strip_invisible(text).strip():
+                    continue
+                x0, y0, x1, y1 = span['bbox']
+                spans.append((text.strip(), x0, y0, x1, y1))
+                span_idx = len(spans) - 1
+                color = span.get('color', 0)
+                text_color = (((color >> 16) & 0xFF) / 255.0, ((color >> 8) & 0xFF) / 255.0, (color & 0xFF) / 255.0)
+                font_by_span_idx.append((span.get('font', 'Helvetica'), span.get('size', 12.0), text_color))
+                for y in range(int(y0), int(y1) + 1):
+                    y_bucket.setdefault(y, []).append(span_idx)
+    return {'spans': spans, 'font_by_span_idx': font_by_span_idx, 'y_bucket': y_bucket}
+
+
+def get_font_info(page, rect, search_text=None, font_index=None):
+    """
+    Extract font name, size, and color for the placeholder text.
+    Pass the page's build_page_font_index() result to avoid rebuilding it for
+    every placeholder.
+    Returns: font_name, font_size, text_color (as tuple)
+    """
+    if font_index is None:
+        font_index = build_page_font_index(page)
+    spans = font_index['spans']
+    y_bucket = font_index['y_bucket']
+    rx0, ry0, rx1, ry1 = rect.x0, rect.y0, rect.x1, rect.y1
+    if rx0 >= rx1 or ry0 >= ry1:
+        return 'Helvetica', 12.0, (0, 0, 0)
+    candidates = set()
+    for y in range(int(ry0) - 1, int(ry1) + 2):
+        candidates.update(y_bucket.get(y, ()))
+    for span_idx in sorted(candidates):
+        text, bx0, by0, bx1, by1 = spans[span_idx]
+        # Cheap substring test first, then a scalar overlap test on the raw bbox
+        if search_text is not None and search_text not in text:
+            continue
+        if bx0 < bx1 and by0 < by1 and bx0 < rx1 and rx0 < bx1 and by0 < ry1 and ry0 < by1:
+            return font_index['font_by_span_idx'][span_idx]
     return 'Helvetica', 12.0, (0, 0, 0)
 
 def get_cell_dimensions(cell_rect):
@@ -470,14 +654,22 @@ def get_cell_dimensions(cell_rect):
 
 def _union_rects(rects, padding=1.5):
     """
-    Combine multiple rectangles into one, expanded slightly by padding.
+    Combine multiple rectangles (fitz.Rect or (x0, y0, x1, y1) tuples) into one,
+    expanded slightly by padding.
     """
     if not rects:
         return None
-    x0 = min(r.x0 for r in rects)
-    y0 = min(r.y0 for r in rects)
-    x1 = max(r.x1 for r in rects)
-    y1 = max(r.y1 for r in rects)
+    it = iter(rects)
+    x0, y0, x1, y1 = next(it)
+    for rx0, ry0, rx1, ry1 in it:
+        if rx0 < x0:
+            x0 = rx0
+        if ry0 < y0:
+            y0 = ry0
+        if rx1 > x1:
+            x1 = rx1
+        if ry1 > y1:
+            y1 = ry1
     return fitz.Rect(x0 - padding, y0 - padding, x1 + padding, y1 + padding)
 
 def _center_square(rect):
@@ -498,7 +690,7 @@ def _snap_rect(rect, field_type):
     """
     if rect is None:
         return rect
-    if field_type in (fitz.PDF_WIDGET_TYPE_CHECKBOX, fitz.PDF_WIDGET_TYPE_RADIOBUTTON):
+    if field_type in (WIDGET_CHECKBOX, WIDGET_RADIOBUTTON):
         return _center_square(rect)
     return rect
 
@@ -519,29 +711,31 @@ def build_page_text_index(page):
     """
     Build a whitespace-free string for the page along with span ownership metadata.
     Now also tracks character positions within each span for precise redaction.
+    Spans come from the flat get_text("words") output, so every word carries its
+    own exact bbox and no font metadata is materialized here.
     """
-    text_dict = page.get_text("dict")
     spans = []
     combined_parts = []
-    char_to_span = []
-    char_to_pos_in_span = []  # Track position of each char within its span's clean text
-    for block in text_dict.get('blocks', []):
-        for line in block.get('lines', []):
-            for span in line.get('spans', []):
-                text = strip_invisible(span.get('text', ''))
-                if not text:
-                    continue
-                clean_text = re.sub(r'\s+', '', text)
-                if not clean_text:
-                    continue
-                rect = fitz.Rect(span['bbox'])
-                original_text = span.get('text', '')
-                spans.append({'rect': rect, 'text': original_text, 'clean_text': clean_text})
-                span_idx = len(spans) - 1
-                for pos_in_clean, char in enumerate(clean_text):
-                    combined_parts.append(char)
-                    char_to_span.append(span_idx)
-                    char_to_pos_in_span.append(pos_in_clean)
+    # Compact int32 arrays: one entry per character of page_clean
+    char_to_span = array.array('i')
+    char_to_pos_in_span = array.array('i')  # Track position of each char within its span's clean text
+    for word in page.get_text("words"):
+        original_text = word[4]
+        clean_text = original_text.translate(_INVISIBLE_AND_WS_TRANSLATE)
+        if not clean_text:
+            continue
+        bbox = tuple(word[:4])
+        spans.append({
+            'bbox': bbox,
+            'text': original_text,
+            'clean_text': clean_text,
+            'char_width': (bbox[2] - bbox[0]) / len(clean_text),
+        })
+        span_idx = len(spans) - 1
+        n = len(clean_text)
+        combined_parts.append(clean_text)
+        char_to_span.extend(itertools.repeat(span_idx, n))
+        char_to_pos_in_span.extend(range(n))
     return {
         'spans': spans,
         'page_clean': ''.join(combined_parts),
@@ -553,27 +747,29 @@ def _compute_partial_span_rect(span_info, start_pos, end_pos):
     """
     Compute a sub-rectangle within a span for characters from start_pos to end_pos
     (positions in the clean_text). Uses proportional width estimation with safety margins.
+    Works on the span's plain (x0, y0, x1, y1) bbox and returns a tuple of the same form.
     """
-    rect = span_info['rect']
+    bbox = span_info['bbox']
     clean_text = span_info.get('clean_text', '')
     total_chars = len(clean_text)
     
     if total_chars == 0:
-        return rect
+        return bbox
     
     # If the entire span is covered, return the full rect
     if start_pos == 0 and end_pos >= total_chars:
-        return rect
+        return bbox
     
-    # Estimate character width (proportional)
-    char_width = rect.width / total_chars
+    span_x0, span_y0, span_x1, span_y1 = bbox
+    # Estimate character width (proportional); precomputed per span by build_page_text_index
+    char_width = span_info['char_width']
     
     # Calculate the sub-rectangle with safety margins to avoid cutting into adjacent text
     # Add a small inward margin (about half a character width) at boundaries that aren't at span edges
     margin = char_width * 0.5
     
-    x0 = rect.x0 + (start_pos * char_width)
-    x1 = rect.x0 + (end_pos * char_width)
+    x0 = span_x0 + (start_pos * char_width)
+    x1 = span_x0 + (end_pos * char_width)
     
     # Only apply margin if not at the start of the span
     if start_pos > 0:
@@ -587,32 +783,121 @@ def _compute_partial_span_rect(span_info, start_pos, end_pos):
     if x1 <= x0:
         x1 = x0 + char_width
     
-    return fitz.Rect(x0, rect.y0, x1, rect.y1)
+    return (x0, span_y0, x1, span_y1)
 
 
 def _union_rects_no_padding(rects):
     """
     Combine multiple rectangles into one without adding padding.
     """
-    if not rects:
-        return None
-    x0 = min(r.x0 for r in rects)
-    y0 = min(r.y0 for r in rects)
-    x1 = max(r.x1 for r in rects)
-    y1 = max(r.y1 for r in rects)
-    return fitz.Rect(x0, y0, x1, y1)
+    return _union_rects(rects, padding=0)
+
+
+def _merge_redact_rects(rects):
+    """
+    Deduplicate redaction rectangles and merge those that touch or overlap on the
+    same text line, so apply_redactions has fewer annotations to process.
+    Rects on different lines are never merged, to avoid redacting text between them.
+    """
+    merged = []
+    for x0, y0, x1, y1 in sorted(set(map(tuple, rects)), key=lambda r: (r[1], r[3], r[0])):
+        if merged:
+            mx0, my0, mx1, my1 = merged[-1]
+            if y0 == my0 and y1 == my1 and x0 <= mx1:
+                if x1 > mx1:
+                    merged[-1] = (mx0, my0, x1, my1)
+                continue
+        merged.append((x0, y0, x1, y1))
+    return merged
+
+
+def _page_cell_boxes(tables):
+    """
+    Flatten the cells of every table on a page into plain (x0, y0, x1, y1) tuples.
+    Merged cells are reported as None by find_tables and are skipped.
+    """
+    return [
+        (cell[0], cell[1], cell[2], cell[3])
+        for table in tables
+        for cell in table.cells
+        if cell is not None
+    ]
+
+
+# Side length (points) of the uniform grid used to bin table cells
+_CELL_GRID_SIZE = 64
+
+
+def _grid_range(lo, hi):
+    return range(int(lo // _CELL_GRID_SIZE), int(hi // _CELL_GRID_SIZE) + 1)
+
+
+def _build_cell_grid(cells):
+    """
+    Bin cell indices into a uniform grid keyed by (column, row) of _CELL_GRID_SIZE
+    squares, so a placeholder only has to be tested against the cells near it.
+    """
+    grid = {}
+    for cell_idx, (x0, y0, x1, y1) in enumerate(cells):
+        for gx in _grid_range(x0, x1):
+            for gy in _grid_range(y0, y1):
+                grid.setdefault((gx, gy), []).append(cell_idx)
+    return grid
+
+
+def _best_cell(cells, rect, grid=None):
+    """
+    Return the cell tuple overlapping rect by the largest area, or None.
+    Works on raw coordinates so no Rect is allocated per cell. With a grid from
+    _build_cell_grid only the cells sharing a grid square with rect are tested.
+    """
+    rx0, ry0, rx1, ry1 = rect.x0, rect.y0, rect.x1, rect.y1
+    if grid is not None:
+        candidates = set()
+        for gx in _grid_range(rx0, rx1):
+            for gy in _grid_range(ry0, ry1):
+                candidates.update(grid.get((gx, gy), ()))
+        # Keep page order so ties still go to the first cell found
+        candidates = [cells[i] for i in sorted(candidates)]
+    else:
+        candidates = cells
+    best = None
+    max_area = 0
+    for cell in candidates:
+        x0, y0, x1, y1 = cell
+        iw = (x1 if x1 < rx1 else rx1) - (x0 if x0 > rx0 else rx0)
+        if iw <= 0:
+            continue
+        ih = (y1 if y1 < ry1 else ry1) - (y0 if y0 > ry0 else ry0)
+        if ih <= 0:
+            continue
+        area = iw * ih
+        if area > max_area:
+            max_area = area
+            best = cell
+    return best
+
 
+# One placeholder found on a page; unpacks like the plain (ph, rect, redacts) triple
+Detection = namedtuple('Detection', ('placeholder', 'rect', 'redact_rects'))
 
-def iter_placeholders(page):
+
+def iter_placeholders(page, index=None):
     """
-    Yield (placeholder_tag, detection_rect, redact_rects) tuples detected from the page text index.
+    Yield Detection(placeholder, detection_rect, redact_rects) records detected from the page text index.
     detection_rect is the bounding box for field placement (with padding).
-    redact_rects is a list of precise rectangles to redact (only the placeholder text).
+    redact_rects is a list of precise (x0, y0, x1, y1) tuples to redact (only the placeholder text);
+    only detection_rect is materialized as a fitz.Rect.
     """
-    index = build_page_text_index(page)
+    if index is None:
+        index = build_page_text_index(page)
     page_clean = index['page_clean']
     if not page_clean:
         return []
+    # Cheap substring prefilter: most pages hold no placeholders at all
+    page_lower = page_clean.lower()
+    if not any(suffix in page_lower for suffix in _PLACEHOLDER_TYPE_SUFFIXES):
+        return []
     char_to_span = index['char_to_span']
     char_to_pos_in_span = index['char_to_pos_in_span']
     spans = index['spans']
@@ -621,50 +906,325 @@ def iter_placeholders(page):
         placeholder = normalize_placeholder_token(match.group(1))
         start, end = match.span()
         
-        # Build precise redaction rectangles for each span segment
+        # Build precise redaction rectangles for each span segment. Spans occupy
+        # contiguous, ordered runs of page_clean, so only the first and last span
+        # covered by the match can be partial; everything in between is whole.
         redact_rects = []
-        # Group consecutive characters by span
-        span_ranges = {}  # span_idx -> (min_pos, max_pos) in that span's clean_text
-        for i in range(start, end):
-            if i >= len(char_to_span):
-                continue
-            span_idx = char_to_span[i]
-            pos_in_span = char_to_pos_in_span[i]
-            if span_idx not in span_ranges:
-                span_ranges[span_idx] = [pos_in_span, pos_in_span + 1]
-            else:
-                span_ranges[span_idx][0] = min(span_ranges[span_idx][0], pos_in_span)
-                span_ranges[span_idx][1] = max(span_ranges[span_idx][1], pos_in_span + 1)
-        
-        # Compute precise sub-rectangles for each span
-        for span_idx, (min_pos, max_pos) in span_ranges.items():
-            if 0 <= span_idx < len(spans):
-                span_info = spans[span_idx]
-                partial_rect = _compute_partial_span_rect(span_info, min_pos, max_pos)
-                redact_rects.append(partial_rect)
+        if end <= start:
+            continue
+        first_span = char_to_span[start]
+        last_span = char_to_span[end - 1]
+        for span_idx in range(first_span, last_span + 1):
+            span_info = spans[span_idx]
+            min_pos = char_to_pos_in_span[start] if span_idx == first_span else 0
+            max_pos = char_to_pos_in_span[end - 1] + 1 if span_idx == last_span else len(span_info['clean_text'])
+            redact_rects.append(_compute_partial_span_rect(span_info, min_pos, max_pos))
         
         # Detection rect for field placement uses union with padding
         detection_rect = _union_rects(redact_rects) if redact_rects else None
         
         if detection_rect:
-            detections.append((placeholder, detection_rect, redact_rects))
+            detections.append(Detection(placeholder, detection_rect, redact_rects))
     return detections
 
-def add_form_field(page, rect, field_type, field_name, is_required, is_readonly, options_dict, field_type_str, font_name, font_size, text_color, found_in_table=False, radio_handling=None):
+def _scan_page(page):
     """
-    Add a widget (form field) to the page at the given rect.
+    Read-only analysis of one page: its placeholder detections and, only when it
+    has any, the flattened table cell boxes used to size the fields.
+    """
+    detections = iter_placeholders(page)
+    cells = _page_cell_boxes(page.find_tables(strategy="lines")) if detections else []
+    return detections, cells
+
+
+def _scan_pages(pdf_path, page_numbers):
+    """
+    Worker for scan_placeholders: open the PDF in this process (PyMuPDF documents
+    cannot be shared across processes) and scan the given pages. Rects are
+    returned as plain tuples so the results pickle cheaply.
     """
+    doc = fitz.open(pdf_path)
     try:
-        widget = fitz.Widget()
-    except Exception as e:
-        print(f"add_form_field: failed to create Widget object: {e}")
-        raise
+        results = []
+        for page_num in page_numbers:
+            detections, cells = _scan_page(doc[page_num])
+            results.append(([
+                Detection(ph, tuple(detection_rect), [tuple(r) for r in redact_rects])
+                for ph, detection_rect, redact_rects in detections
+            ], cells))
+        return results
+    finally:
+        doc.close()
+
+
+def scan_placeholders(pdf_path, page_count, workers=None):
+    """
+    Run _scan_page (placeholder detection plus table detection) over every page in
+    a process pool, one contiguous chunk of pages per worker. Returns a list of
+    per-page (detections, cells) pairs, or None when the document is too small to
+    benefit (or the pool fails) so the caller can scan pages in-process instead.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, page_count)
+    if workers <= 1 or page_count < PARALLEL_SCAN_MIN_PAGES:
+        return None
+    chunk = -(-page_count // workers)
+    chunks = [range(start, min(start + chunk, page_count)) for start in range(0, page_count, chunk)]
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunk_results = list(executor.map(_scan_pages, itertools.repeat(pdf_path), chunks))
+    except Exception as exc:
+        log.warning("Parallel placeholder scan failed (%s); scanning pages sequentially", exc)
+        return None
+    page_scans = []
+    for results in chunk_results:
+        for detections, cells in results:
+            page_scans.append(([
+                detection._replace(rect=fitz.Rect(detection.rect))
+                for detection in detections
+            ], cells))
+    return page_scans
+
+def _load_live_widget(page, annot, field_name, rect):
+    """
+    Return the page's Widget for an annotation just created by page.add_widget.
+    Loads it directly by xref; only falls back to scanning page.widgets() for the
+    name/rect pair when the xref is unavailable.
+    """
+    xref = getattr(annot, 'xref', None)
+    if xref:
+        try:
+            return page.load_widget(xref)
+        except Exception:
+            pass
+    target = (rect.x0, rect.y0, rect.x1, rect.y1)
+    try:
+        for w in page.widgets():
+            try:
+                wr = w.rect
+                if w.field_name == field_name and (wr.x0, wr.y0, wr.x1, wr.y1) == target:
+                    return w
+            except Exception:
+                continue
+    except Exception:
+        pass
+    return None
+
+
+def _override_dimensions(x0, y0, x1, y1, options_dict):
+    """
+    Apply the tag's width/height options to a rect given as coordinates. The top-left
+    corner stays put; returns the new (x1, y1).
+    """
+    new_width = x1 - x0
+    if 'cellwidth' in options_dict:
+        new_width = float(options_dict['cellwidth'])
+    elif 'columnwidth' in options_dict:
+        new_width = float(options_dict['columnwidth'])
+    elif 'width' in options_dict:
+        new_width = float(options_dict['width'])
+
+    new_height = y1 - y0
+    if 'rowheight' in options_dict:
+        new_height = float(options_dict['rowheight'])
+    elif 'height' in options_dict:
+        new_height = float(options_dict['height'])
+
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Overriding dimensions: original rect %s, new size %gx%g, options %s",
+                  (x0, y0, x1, y1), new_width, new_height, options_dict)
+    return x0 + new_width, y0 + new_height
+
+
+def _setup_plain_field(widget, rect, field_type_str, options_dict, font_name, font_size, text_color):
+    """
+    Default setup for widget kinds without type-specific options.
+    """
+    widget.rect = _snap_rect(rect, widget.field_type)
+
+
+def _setup_text_field(widget, rect, field_type_str, options_dict, font_name, font_size, text_color):
+    """
+    Text widgets: font, flags, length guard, default value and format scripts.
+    """
+    # Apply font formatting for text-based fields (do not apply to signature widgets)
+    widget.text_font = font_name
+    widget.text_fontsize = font_size
+    widget.text_color = text_color
+
+    # Handle text field variants (multiline, rich text, password, hidden); always
+    # prevent text overflow/scrolling when the field is full
+    flags = widget.field_flags | _TEXT_FIELD_FLAGS.get(field_type_str, 0) | TX_FIELD_IS_DONOTSCROLL
+    widget.field_flags = flags
+    multiline = bool(flags & TX_FIELD_IS_MULTILINE)
+
+    widget.text_margin = (0, 0, 0, 0)
+
+    # For single-line fields, adjust height to prevent vertical centering; tag
+    # dimensions then override it. The final rect is computed locally and assigned once
+    x0, y0, x1, y1 = rect.x0, rect.y0, rect.x1, rect.y1
+    if not multiline:
+        y1 = y0 + font_size * 1.5
+    # The length limit is sized from the placeholder geometry, before tag overrides
+    field_rect = fitz.Rect(x0, y0, x1, y1)
+    max_len = estimate_max_length(field_rect, font_size, multiline)
+    if not options_dict.keys().isdisjoint(_DIM_KEYS):
+        x1, y1 = _override_dimensions(x0, y0, x1, y1, options_dict)
+        field_rect = fitz.Rect(x0, y0, x1, y1)
+    widget.rect = field_rect
+    guard_script = None
+    if max_len:
+        widget.max_len = max_len
+        guard_script = _build_length_guard(max_len)
+
+    # Set default value if provided
+    if 'default' in options_dict:
+        widget.field_value = options_dict['default']
+
+    # Format scripts for special fields or format option
+    if 'format' in options_dict:
+        scripts = _FORMAT_SCRIPTS.get(options_dict['format'].lower())
+    else:
+        scripts = _FIELD_SCRIPTS.get(field_type_str)
+    if scripts:
+        script_format, script = scripts
+        if script_format:
+            widget.script_format = script_format
+        widget.script = script
+
+    # Calculated field
+    if field_type_str == 'calculatedfield' and 'calculation' in options_dict:
+        widget.script = options_dict['calculation']
+
+    # Validation field
+    if field_type_str == 'validationfield' and 'validation' in options_dict:
+        widget.script = options_dict['validation']
+
+    # Barcode field
+    if field_type_str in ['barcodefield', 'qrcodefield', 'pdf417field', 'code128field']:
+        if 'data' in options_dict:
+            widget.field_value = options_dict['data']
+    if guard_script:
+        existing_script = getattr(widget, 'script', '') or ''
+        widget.script = f"{existing_script}\n{guard_script}".strip() if existing_script else guard_script
+
+
+def _setup_choice_field(widget, rect, field_type_str, options_dict, font_name, font_size, text_color):
+    """
+    Combobox/listbox widgets: font, choice values, multi-select and default value.
+    """
+    widget.rect = _snap_rect(rect, widget.field_type)
+    # Apply font formatting for text-based fields (do not apply to signature widgets)
+    widget.text_font = font_name
+    widget.text_fontsize = font_size
+    widget.text_color = text_color
+
+    # Add options if provided
+    raw_options = options_dict.get('options')
+    if raw_options:
+        options = tuple(opt.strip() for opt in raw_options.split(','))
+        widget.choice_values = options
+        if options and 'default' not in options_dict:
+            widget.field_value = options[0]  # Default to first option
+    if widget.field_type == WIDGET_LISTBOX and 'multi' in options_dict:
+        widget.field_flags |= CH_FIELD_IS_MULTISELECT
+    if 'default' in options_dict:
+        widget.field_value = options_dict['default']
+
+
+def _setup_checkbox_field(widget, rect, field_type_str, options_dict, font_name, font_size, text_color):
+    """
+    Checkbox widgets: centered square rect and export value caption.
+    """
+    widget.rect = _snap_rect(rect, widget.field_type)
+    # If a desired export value/default is provided, set it as the button caption
+    provided_val = options_dict.get('value') or options_dict.get('default')
+    if provided_val:
+        widget.button_caption = provided_val
+    # Acrobat commonly expects the export value 'Yes' for checked state. If the user
+    # did not provide an export value and a default is requested, set the export
+    # caption to 'Yes' (and set the field default/value in later steps).
+    if not provided_val and 'default' in options_dict:
+        widget.button_caption = 'Yes'
+
+
+def _setup_radio_field(widget, rect, field_type_str, options_dict, font_name, font_size, text_color):
+    """
+    Radio widgets: centered square rect and export value caption.
+    add_form_field has already normalized the export value into options_dict['value'].
+    """
+    widget.rect = _snap_rect(rect, widget.field_type)
+    widget.button_caption = options_dict.get('value') or 'Yes'
+
+
+def _setup_button_field(widget, rect, field_type_str, options_dict, font_name, font_size, text_color):
+    """
+    Push/submit/reset buttons: button type, caption, submit URL and tooltip.
+    """
+    widget.rect = _snap_rect(rect, widget.field_type)
+    if field_type_str in ['pushbutton', 'imagebutton']:
+        widget.button_type = BTN_PUSH
+    elif field_type_str == 'submitbutton':
+        widget.button_type = BTN_SUBMIT
+    elif field_type_str == 'resetbutton':
+        widget.button_type = BTN_RESET
+    if 'label' in options_dict:
+        widget.button_caption = options_dict['label']
+    elif field_type_str == 'pushbutton':
+        widget.button_caption = 'Button'
+    elif field_type_str == 'submitbutton':
+        widget.button_caption = 'Submit'
+    elif field_type_str == 'resetbutton':
+        widget.button_caption = 'Reset'
+    if 'url' in options_dict and field_type_str == 'submitbutton':
+        widget.submit_url = options_dict['url']
+    # Tooltip
+    if 'tooltip' in options_dict:
+        widget.field_tooltip = options_dict['tooltip']
+
+
+def _setup_signature_field(widget, rect, field_type_str, options_dict, font_name, font_size, text_color):
+    """
+    Signature widgets: stay interactive and carry no text properties or value.
+    """
+    widget.rect = _snap_rect(rect, widget.field_type)
+    # Ensure signature widgets stay interactive even when marked as required
+    widget.field_flags &= ~FIELD_IS_READONLY
+    # Ensure no text font, color or default value gets applied to signature widgets
+    for name, value in _SIG_DEFAULTS:
+        setattr(widget, name, value)
+    # Add a tooltip to help Acrobat identify the field as a signature box
+    if 'tooltip' not in options_dict:
+        widget.field_tooltip = 'Sign here'
+    widget.sig_flags = (getattr(widget, 'sig_flags', 0) or 0) | SIG_FLAG_DIGITAL
+
+
+# Widget type -> setup function for the options specific to that kind of widget
+_FIELD_HANDLERS = {
+    WIDGET_TEXT: _setup_text_field,
+    WIDGET_COMBOBOX: _setup_choice_field,
+    WIDGET_LISTBOX: _setup_choice_field,
+    WIDGET_CHECKBOX: _setup_checkbox_field,
+    WIDGET_RADIOBUTTON: _setup_radio_field,
+    WIDGET_BUTTON: _setup_button_field,
+    WIDGET_SIGNATURE: _setup_signature_field,
+}
+
+
+def add_form_field(page, rect, field_type, field_name, is_required, is_readonly, options_dict, field_type_str, font_name, font_size, text_color, found_in_table=False, radio_handling=None, radio_parent=None):
+    """
+    Add a widget (form field) to the page at the given rect.
+    radio_parent is the xref of the first option already created for this radio group.
+    Returns the group's parent xref for radio buttons (to pass into the next option), else None.
+    """
     if rect is None:
-        print(f"No rect available for field '{field_name}', skipping")
+        log.warning("No rect available for field '%s', skipping", field_name)
         return
+    widget = fitz.Widget()
     radiomode = radio_handling or RADIO_HANDLING
     radio_export_value = None
-    if field_type == fitz.PDF_WIDGET_TYPE_RADIOBUTTON:
+    if field_type == WIDGET_RADIOBUTTON:
         raw_radio_value = options_dict.get('value') or options_dict.get('default') or field_name
         radio_export_value = _normalize_export_value(raw_radio_value)
         options_dict['value'] = radio_export_value
@@ -672,397 +1232,107 @@ def add_form_field(page, rect, field_type, field_name, is_required, is_readonly,
     widget.field_type = field_type
     # Ensure text_color/text_font properties exist on the widget to satisfy
     # PyMuPDF's internal validation code; set a safe default (black) where needed.
-    try:
-        if not getattr(widget, 'text_color', None):
-            widget.text_color = text_color if text_color else (0, 0, 0)
-    except Exception:
-        pass
+    if not getattr(widget, 'text_color', None):
+        widget.text_color = text_color if text_color else (0, 0, 0)
     # Proceed with widget setup
-    # Debug: print type info for signature troubleshooting
-    if field_type_str in ('signaturefield', 'digitalsignaturefield') or field_type == fitz.PDF_WIDGET_TYPE_SIGNATURE:
-        try:
-            print(f"add_form_field: creating SIGNATURE field: name={field_name}, field_type={field_type}, field_type_str={field_type_str}")
-        except Exception:
-            pass
+    # Debug: log type info for signature troubleshooting
+    if field_type_str in ('signaturefield', 'digitalsignaturefield') or field_type == WIDGET_SIGNATURE:
+        log.debug("add_form_field: creating SIGNATURE field: name=%s, field_type=%s, field_type_str=%s",
+                  field_name, field_type, field_type_str)
     
     # Remove red background to make fields invisible
     # widget.fill_color = (1, 0, 0)  # RGB red - commented out for invisible fields
     
-    if is_required:
-        widget.field_flags |= FIELD_IS_REQUIRED
-    
-    if is_readonly:
-        widget.field_flags |= FIELD_IS_READONLY
+    if is_required or is_readonly:
+        widget.field_flags |= (FIELD_IS_REQUIRED if is_required else 0) | (FIELD_IS_READONLY if is_readonly else 0)
     
-    # Adjust rect for specific types
-    if field_type == fitz.PDF_WIDGET_TYPE_CHECKBOX:
-        widget.rect = _snap_rect(rect, field_type)
-        # If a desired export value/default is provided, set it as the button caption
-        provided_val = options_dict.get('value') or options_dict.get('default')
-        if provided_val:
-            try:
-                widget.button_caption = provided_val
-            except Exception:
-                # Some PyMuPDF versions may not support button_caption on checkboxes
-                pass
-        # Acrobat commonly expects the export value 'Yes' for checked state. If the user
-        # did not provide an export value and a default is requested, set the export
-        # caption to 'Yes' (and set the field default/value in later steps).
-        if not provided_val and 'default' in options_dict:
-            try:
-                widget.button_caption = 'Yes'
-            except Exception:
-                pass
-    elif field_type == fitz.PDF_WIDGET_TYPE_RADIOBUTTON:
+    if field_type == WIDGET_RADIOBUTTON:
         if radiomode == 'skip':
-            print(f"Skipping radio field '{field_name}' (mode=skip)")
+            log.info("Skipping radio field '%s' (mode=skip)", field_name)
             return
-        widget.rect = _snap_rect(rect, field_type)
-        existing_parent = RADIO_PARENTS.get(field_name)
-        if existing_parent:
-            widget.rb_parent = existing_parent
-    else:
-        widget.rect = _snap_rect(rect, field_type)
-    
-        # Apply font formatting for text-based fields (do not apply to signature widgets)
-        if field_type in (fitz.PDF_WIDGET_TYPE_TEXT, fitz.PDF_WIDGET_TYPE_COMBOBOX, fitz.PDF_WIDGET_TYPE_LISTBOX):
-            widget.text_font = font_name
-            widget.text_fontsize = font_size
-            widget.text_color = text_color
-    
-    # Handle text field variants
-    if field_type == fitz.PDF_WIDGET_TYPE_TEXT:
-        # Multiline only for specific types
-        if field_type_str in ['multilinetextfield', 'richtextfield']:
-            widget.field_flags |= fitz.PDF_TX_FIELD_IS_MULTILINE
-        
-        # Rich text
-        if field_type_str in ['richtextfield']:
-            widget.field_flags |= fitz.PDF_TX_FIELD_IS_RICH_TEXT
-        
-        # Password
-        if field_type_str in ['passwordfield']:
-            widget.field_flags |= fitz.PDF_TX_FIELD_IS_PASSWORD
-        
-        # Hidden
-        if field_type_str in ['hiddenfield']:
-            widget.field_flags |= fitz.PDF_FIELD_IS_HIDDEN
-        
-        # Prevent text overflow/scrolling when field is full
-        widget.field_flags |= 0x800000  # PDF_TX_FIELD_IS_DONOTSCROLL
-        
-        widget.text_margin = (0, 0, 0, 0)
-        
-        # For single-line fields, adjust height to prevent vertical centering
-        if not (widget.field_flags & fitz.PDF_TX_FIELD_IS_MULTILINE):
-            widget.rect.y1 = widget.rect.y0 + widget.text_fontsize * 1.5
-        
-        multiline = bool(widget.field_flags & fitz.PDF_TX_FIELD_IS_MULTILINE)
-        max_len = estimate_max_length(widget.rect, widget.text_fontsize or font_size, multiline)
-        guard_script = None
-        if max_len:
-            try:
-                widget.max_len = max_len
-            except Exception:
-                pass
-            guard_script = _build_length_guard(max_len)
-        
-        # Set default value if provided
-        if 'default' in options_dict:
-            widget.field_value = options_dict['default']
-        
-        # Format scripts for special fields or format option
-        if 'format' in options_dict:
-            fmt = options_dict['format'].lower()
-            if fmt == 'date':
-                widget.script_format = 'AFDate_FormatEx("yyyy-mm-dd");'
-                widget.script = 'AFDate_KeystrokeEx("yyyy-mm-dd");'
-            elif fmt == 'number':
-                widget.script_format = 'AFNumber_Format(0, 0, 0, 0, "", false);'
-                widget.script = 'AFNumber_Keystroke(0, 0, 0, 0, "", false);'
-            elif fmt == 'currency':
-                widget.script_format = 'AFNumber_Format(2, 0, 0, 0, "$", false);'
-                widget.script = 'AFNumber_Keystroke(2, 0, 0, 0, "$", false);'
-            elif fmt == 'percent':
-                widget.script_format = 'AFPercent_Format(2, 0, 0, 0, "", false);'
-                widget.script = 'AFPercent_Keystroke(2, 0, 0, 0, "", false);'
-            elif fmt == 'email':
-                widget.script = 'event.rc = /^\\S+@\\S+\\.\\S+$/.test(event.value) || event.value == "";'
-            elif fmt == 'phone':
-                widget.script = 'event.rc = /^\\d{10}$/.test(event.value.replace(/\\D/g, "")) || event.value == "";'
-        elif field_type_str in ['datefield', 'date']:
-            widget.script_format = 'AFDate_FormatEx("yyyy-mm-dd");'
-            widget.script = 'AFDate_KeystrokeEx("yyyy-mm-dd");'
-            # Add a simple on-entry script that makes Acrobat recognize it as a date field
-            try:
-                widget.script = 'AFDate_KeystrokeEx("yyyy-mm-dd");'
-            except Exception:
-                pass
-        elif field_type_str == 'timefield':
-            widget.script_format = 'AFTime_FormatEx("HH:MM");'
-            widget.script = 'AFTime_KeystrokeEx("HH:MM");'
-        elif field_type_str == 'datetimefield':
-            widget.script_format = 'AFDate_FormatEx("yyyy-mm-dd HH:MM");'
-            widget.script = 'AFDate_KeystrokeEx("yyyy-mm-dd HH:MM");'
-        elif field_type_str in ['numericfield', 'numberfield']:
-            widget.script_format = 'AFNumber_Format(0, 0, 0, 0, "", false);'
-            widget.script = 'AFNumber_Keystroke(0, 0, 0, 0, "", false);'
-        elif field_type_str == 'decimalfield':
-            widget.script_format = 'AFNumber_Format(2, 0, 0, 0, "", false);'
-            widget.script = 'AFNumber_Keystroke(2, 0, 0, 0, "", false);'
-        elif field_type_str == 'currencyfield':
-            widget.script_format = 'AFNumber_Format(2, 0, 0, 0, "$", false);'
-            widget.script = 'AFNumber_Keystroke(2, 0, 0, 0, "$", false);'
-        elif field_type_str == 'percentfield':
-            widget.script_format = 'AFPercent_Format(2, 0, 0, 0, "", false);'
-            widget.script = 'AFPercent_Keystroke(2, 0, 0, 0, "", false);'
-        elif field_type_str == 'emailfield':
-            # Basic email validation script
-            widget.script = 'event.rc = /^\\S+@\\S+\\.\\S+$/.test(event.value) || event.value == "";'
-        elif field_type_str == 'phonefield':
-            # Basic phone validation (adjust as needed)
-            widget.script = 'event.rc = /^\\d{10}$/.test(event.value.replace(/\\D/g, "")) || event.value == "";'
-        
-        # Calculated field
-        if field_type_str == 'calculatedfield' and 'calculation' in options_dict:
-            widget.script = options_dict['calculation']
-        
-        # Validation field
-        if field_type_str == 'validationfield' and 'validation' in options_dict:
-            widget.script = options_dict['validation']
-        
-        # Barcode field
-        if field_type_str in ['barcodefield', 'qrcodefield', 'pdf417field', 'code128field']:
-            if 'data' in options_dict:
-                widget.field_value = options_dict['data']
-        if guard_script:
-            existing_script = getattr(widget, 'script', '') or ''
-            widget.script = f"{existing_script}\n{guard_script}".strip() if existing_script else guard_script
-    
-    # For choice fields (combobox, listbox), add options if provided
-    if field_type in (fitz.PDF_WIDGET_TYPE_COMBOBOX, fitz.PDF_WIDGET_TYPE_LISTBOX):
-        if 'options' in options_dict:
-            options = [opt.strip() for opt in options_dict['options'].split(',')]
-            widget.choice_values = options
-            if options and 'default' not in options_dict:
-                widget.field_value = options[0]  # Default to first option
-        if field_type == fitz.PDF_WIDGET_TYPE_LISTBOX and 'multi' in [k.lower() for k in options_dict.keys()]:
-            widget.field_flags |= CH_FIELD_IS_MULTISELECT
-        if 'default' in options_dict:
-            widget.field_value = options_dict['default']
-    
-    # For radio buttons, set button_caption if provided (export value)
-    if field_type == fitz.PDF_WIDGET_TYPE_RADIOBUTTON:
-        caption = radio_export_value or 'Yes'
-        try:
-            widget.button_caption = caption
-        except Exception:
-            pass
-    
-    # For buttons, set button type and caption
-    if field_type == fitz.PDF_WIDGET_TYPE_BUTTON:
-        if field_type_str in ['pushbutton', 'imagebutton']:
-            widget.button_type = BTN_PUSH
-        elif field_type_str == 'submitbutton':
-            widget.button_type = BTN_SUBMIT
-        elif field_type_str == 'resetbutton':
-            widget.button_type = BTN_RESET
-        if 'label' in options_dict:
-            widget.button_caption = options_dict['label']
-        elif field_type_str == 'pushbutton':
-            widget.button_caption = 'Button'
-        elif field_type_str == 'submitbutton':
-            widget.button_caption = 'Submit'
-        elif field_type_str == 'resetbutton':
-            widget.button_caption = 'Reset'
-        if 'url' in options_dict and field_type_str == 'submitbutton':
-            widget.submit_url = options_dict['url']
-    
-        # Tooltip
-        if 'tooltip' in options_dict:
-            widget.field_tooltip = options_dict['tooltip']
+        if radio_parent:
+            widget.rb_parent = radio_parent
 
-    # Signature fields: ensure widget is a signature widget and avoid adding text properties
-    if field_type == fitz.PDF_WIDGET_TYPE_SIGNATURE:
-        # Ensure signature widgets stay interactive even when marked as required
-        try:
-            widget.field_flags &= ~FIELD_IS_READONLY
-        except Exception:
-            pass
-        # Ensure no text font or color gets applied to signature widgets
-        try:
-            # Reset text-specific properties to safe defaults (don't remove properties,
-            # because PyMuPDF validation expects them to exist). Signature fields should
-            # not display text, but we leave a default text color to avoid validation errors.
-            if hasattr(widget, 'text_font'):
-                widget.text_font = None
-            if hasattr(widget, 'text_fontsize'):
-                widget.text_fontsize = None
-            if hasattr(widget, 'text_color'):
-                widget.text_color = (0, 0, 0)
-        except Exception:
-            pass
-        # Signature widgets should not have a default value or choice values
-        try:
-            widget.field_value = None
-        except Exception:
-            pass
-        # Add a tooltip to help Acrobat identify the field as a signature box
-        if 'tooltip' not in options_dict:
-            try:
-                widget.field_tooltip = 'Sign here'
-            except Exception:
-                pass
-        try:
-            widget.sig_flags = (getattr(widget, 'sig_flags', 0) or 0) | SIG_FLAG_DIGITAL
-        except Exception:
-            pass
-    
-        # Add custom dimensions if specified in tag (overrides source dimensions)
-    if any(k in options_dict for k in ['rowheight', 'cellwidth', 'columnwidth', 'width', 'height']):
-        print(f"Overriding dimensions for {field_name}: original rect {widget.rect}, options {options_dict}")
-        new_width = widget.rect.width
-        if 'cellwidth' in options_dict:
-            new_width = float(options_dict['cellwidth'])
-        elif 'columnwidth' in options_dict:
-            new_width = float(options_dict['columnwidth'])
-        elif 'width' in options_dict:
-            new_width = float(options_dict['width'])
-        
-        new_height = widget.rect.height
-        if 'rowheight' in options_dict:
-            new_height = float(options_dict['rowheight'])
-        elif 'height' in options_dict:
-            new_height = float(options_dict['height'])
-        
-        widget.rect = fitz.Rect(widget.rect.x0, widget.rect.y0, widget.rect.x0 + new_width, widget.rect.y0 + new_height)
-        print(f"New rect: {widget.rect}")
+    # Type-specific rect, font and option handling
+    handler = _FIELD_HANDLERS.get(field_type, _setup_plain_field)
+    handler(widget, rect, field_type_str, options_dict, font_name, font_size, text_color)
+
+    # Add custom dimensions if specified in tag (overrides source dimensions); text
+    # widgets fold them into their single rect assignment in _setup_text_field
+    if field_type != WIDGET_TEXT and not options_dict.keys().isdisjoint(_DIM_KEYS):
+        x0, y0, x1, y1 = widget.rect
+        x1, y1 = _override_dimensions(x0, y0, x1, y1, options_dict)
+        widget.rect = fitz.Rect(x0, y0, x1, y1)
 
         # Set border colors & widths compatible with Acrobat: red for required, blue for other fields
-    try:
-        if is_required:
-            widget.border_color = REQUIRED_BORDER_COLOR
-            widget.border_width = REQUIRED_BORDER_WIDTH
-        else:
-            widget.border_color = DEFAULT_BORDER_COLOR
-            widget.border_width = DEFAULT_BORDER_WIDTH
-        # consistent border style
-        widget.border_style = 'solid'
-    except Exception:
-        # Not all widgets/versions support these attributes; skip silently
-        pass
+    if is_required:
+        widget.border_color = REQUIRED_BORDER_COLOR
+        widget.border_width = REQUIRED_BORDER_WIDTH
+    else:
+        widget.border_color = DEFAULT_BORDER_COLOR
+        widget.border_width = DEFAULT_BORDER_WIDTH
+    # consistent border style
+    widget.border_style = 'solid'
     
     # Add widget with graceful radio fallback handling
     try:
-        page.add_widget(widget)
-        # Attempt to track the live widget and clear text attributes for signature widgets
-        live_widget = None
-        try:
-            for w in page.widgets():
-                try:
-                    if w.field_name == field_name and fitz.Rect(w.rect) == fitz.Rect(widget.rect):
-                        live_widget = w
-                        break
-                except Exception:
-                    continue
-        except Exception:
-            live_widget = None
-        if live_widget is not None and field_type == fitz.PDF_WIDGET_TYPE_SIGNATURE:
-            try:
-                # Clear any text-specific properties; leave text_color as a default tuple to satisfy validation
-                try:
-                    live_widget.text_font = None
-                except Exception:
-                    pass
-                try:
-                    live_widget.text_fontsize = None
-                except Exception:
-                    pass
-                try:
-                    live_widget.text_color = (0, 0, 0)
-                except Exception:
-                    pass
-                try:
-                    live_widget.update()
-                except Exception:
-                    pass
-            except Exception:
-                pass
+        annot = page.add_widget(widget)
     except Exception as e:
-        if field_type == fitz.PDF_WIDGET_TYPE_RADIOBUTTON:
+        if field_type == WIDGET_RADIOBUTTON:
             if radiomode == 'strict':
                 raise
             if radiomode == 'fallback':
-                print(f"Falling back to checkbox for radio field '{field_name}' ({e})")
-                field_type = fitz.PDF_WIDGET_TYPE_CHECKBOX
-                widget.field_type = fitz.PDF_WIDGET_TYPE_CHECKBOX
+                log.warning("Falling back to checkbox for radio field '%s' (%s)", field_name, e)
+                field_type = WIDGET_CHECKBOX
+                widget.field_type = WIDGET_CHECKBOX
                 widget.rect = _snap_rect(rect, widget.field_type)
-                if hasattr(widget, 'button_caption'):
-                    widget.field_value = widget.button_caption
+                widget.field_value = widget.button_caption
                 try:
-                    page.add_widget(widget)
+                    annot = page.add_widget(widget)
                 except Exception as e2:
-                    print(f"Fallback checkbox failed for {field_name}: {e2}")
+                    log.warning("Fallback checkbox failed for %s: %s", field_name, e2)
                     return
             else:
-                print(f"Skipping radio field '{field_name}' due to error: {e}")
+                log.warning("Skipping radio field '%s' due to error: %s", field_name, e)
                 return
         else:
-            print(f"Skipping widget {field_name} due to error: {e}")
-            import traceback as _tb
-            _tb.print_exc()
+            log.exception("Skipping widget %s due to error: %s", field_name, e)
             return
-    # After adding, find the live widget instance and ensure radio parents are registered
-    live_widget = None
-    try:
-        for w in page.widgets():
-            try:
-                if w.field_name == field_name and fitz.Rect(w.rect) == fitz.Rect(widget.rect):
-                    live_widget = w
-                    break
-            except Exception:
-                continue
-    except Exception:
-        live_widget = None
+    # Track the live widget so radio parents can be registered and signature text cleared.
+    # All post-insert mutations go to one object and are written with a single update().
+    live_widget = _load_live_widget(page, annot, field_name, widget.rect)
+    target = live_widget if live_widget is not None else widget
+    if live_widget is not None and field_type == WIDGET_SIGNATURE:
+        # Clear any text-specific properties; leave text_color as a default tuple to satisfy validation
+        for name, value in _SIG_TEXT_DEFAULTS:
+            setattr(live_widget, name, value)
 
-    if field_type == fitz.PDF_WIDGET_TYPE_RADIOBUTTON:
-        try:
-            print(f"Radio created (live_widget) name={field_name}, rb_parent={getattr(live_widget,'rb_parent', None)}, xref={getattr(live_widget,'xref', None)}")
-        except Exception:
-            pass
-        # If we just created the first radio option, register it as the parent (xref)
-        try:
-            parent = RADIO_PARENTS.get(field_name)
-            if parent is None and live_widget is not None and hasattr(live_widget, 'xref'):
-                RADIO_PARENTS[field_name] = live_widget.xref
-                parent = RADIO_PARENTS[field_name]
-            if parent is not None and live_widget is not None:
-                try:
-                    live_widget.rb_parent = parent
-                except Exception:
-                    pass
-                try:
-                    live_widget.update()
-                except Exception:
-                    pass
-        except Exception:
-            pass
-        _apply_radio_parent(field_name, live_widget)
+    if field_type == WIDGET_RADIOBUTTON:
+        log.debug("Radio created (live_widget) name=%s, rb_parent=%s, xref=%s",
+                  field_name, getattr(live_widget, 'rb_parent', None), getattr(live_widget, 'xref', None))
+        # If we just created the first radio option, it becomes the parent (xref)
+        if radio_parent is None and live_widget is not None:
+            radio_parent = getattr(live_widget, 'xref', None)
+        if radio_parent is not None and live_widget is not None:
+            live_widget.rb_parent = radio_parent
         _ensure_radio_state(live_widget, radio_export_value or options_dict.get('value') or 'Yes')
 
-    # If added successfully, try to ensure appropriate visual appearance and default value.
+    # If added successfully, ensure appropriate visual appearance and default value.
+    # One guarded block covers the whole finalization instead of a try per step.
     try:
+        if field_type in (WIDGET_CHECKBOX, WIDGET_RADIOBUTTON):
+            try:
+                states = list(target.button_states())
+            except Exception:
+                states = []
+
         # For choice fields (combobox/listbox): ensure a default value is set
-        if field_type in (fitz.PDF_WIDGET_TYPE_COMBOBOX, fitz.PDF_WIDGET_TYPE_LISTBOX) and 'default' in options_dict:
-            widget.field_value = options_dict['default']
+        if field_type in (WIDGET_COMBOBOX, WIDGET_LISTBOX) and 'default' in options_dict:
+            target.field_value = options_dict['default']
 
         # For checkboxes and radio buttons, ensure on/off states exist and set field_value accordingly
-        if field_type == fitz.PDF_WIDGET_TYPE_CHECKBOX:
+        if field_type == WIDGET_CHECKBOX:
             # Try to set checked state if 'checked' or 'value' is provided, otherwise leave 'Off'
-            try:
-                states = list(widget.button_states())
-            except Exception:
-                states = []
             # Find a sensible on-state (prefer any state that's not 'Off' or 'Normal')
             on_state = None
             for s in states:
@@ -1071,81 +1341,111 @@ def add_form_field(page, rect, field_type, field_name, is_required, is_readonly,
                     on_state = s
                     break
 
-            # Helper to normalize names for comparison (strip slashes, underscores, case)
-            def norm(name):
-                if name is None:
-                    return None
-                return str(name).strip().lower().lstrip('/').replace('_', '')
-
             provided_val = options_dict.get('value') or options_dict.get('default')
             if provided_val:
-                provided_norm = norm(provided_val)
+                provided_norm = _norm_state_name(provided_val)
                 matched = None
                 for s in states:
-                    if norm(s) == provided_norm:
+                    if _norm_state_name(s) == provided_norm:
                         matched = s
                         break
                 if matched:
-                    widget.field_value = matched
+                    target.field_value = matched
                 elif on_state:
-                    widget.field_value = on_state
+                    target.field_value = on_state
                 else:
-                    print(f"Checkbox '{field_name}': provided default '{provided_val}' did not match any states {states}; attempting raw assignment")
-                    try:
-                        widget.field_value = provided_val
-                    except Exception:
-                        pass
+                    log.warning("Checkbox '%s': provided default '%s' did not match any states %s; attempting raw assignment",
+                                field_name, provided_val, states)
+                    target.field_value = provided_val
             else:
                 # If no provided value but there's a default option, use the first on_state
                 if on_state:
-                    widget.field_value = on_state
+                    target.field_value = on_state
             # Debug output to help diagnose mismatches in tests
-            try:
-                print(f"Checkbox '{field_name}' states={states} -> set field_value={widget.field_value}")
-            except Exception:
-                pass
-            widget.update()
+            log.debug("Checkbox '%s' states=%s -> set field_value=%s", field_name, states, target.field_value)
 
-        if field_type == fitz.PDF_WIDGET_TYPE_RADIOBUTTON:
+        if field_type == WIDGET_RADIOBUTTON:
             # Button caption should supply an export value
-            states = list(widget.button_states())
             on_state = options_dict.get('value') or (states[0] if states else None)
             if on_state and on_state in states:
-                widget.field_value = on_state
-            # Ensure it's grouped (if parent is known)
-            if widget.rb_parent is not None:
-                widget.update()
-            else:
-                # Update anyway to generate an appearance
-                widget.update()
+                target.field_value = on_state
+
+        # Settle the final state here so the document needs no second widget pass before saving
+        if field_type in (WIDGET_CHECKBOX, WIDGET_RADIOBUTTON):
+            # If no value is set, default to the first available on-state
+            if not target.field_value or target.field_value == 'Off':
+                for s in states:
+                    if s.lower() not in ('off', 'normal'):
+                        target.field_value = s
+                        break
+            # Explicit defaults always win
+            if 'default' in options_dict:
+                target.field_value = options_dict['default']
+        elif field_type in (WIDGET_COMBOBOX, WIDGET_LISTBOX) and not target.field_value:
+            vals = getattr(target, 'choice_values', None)
+            if vals:
+                target.field_value = vals[0]
     except Exception as e:
-        print(f"Error finalizing widget '{field_name}': {e}")
+        log.warning("Error finalizing widget '%s': %s", field_name, e)
+
+    # Write every pending change (text props, parent, caption, value) in one pass
+    if field_type in (WIDGET_SIGNATURE, WIDGET_CHECKBOX, WIDGET_RADIOBUTTON, WIDGET_COMBOBOX, WIDGET_LISTBOX):
+        try:
+            target.update()
+        except Exception as e:
+            log.warning("Error finalizing widget '%s': %s", field_name, e)
     # End widget setup
+    if field_type == WIDGET_RADIOBUTTON:
+        return radio_parent
+    return None
 
-def convert_docx_to_fillable_pdf(pdf_path, output_pdf_path, radio_handling=None):
+def _set_need_appearances(doc):
     """
-    Processes a PDF file by detecting placeholders like {{textbox:firstname}}
-    and replacing them with PDF form fields that automatically size to table cell dimensions.
+    Set AcroForm/NeedAppearances so viewers regenerate widget appearances themselves.
+    Document.need_appearances is a method in PyMuPDF (assigning to it does nothing);
+    fall back to writing the catalog key directly if the call is unavailable.
     """
-    doc = fitz.open(pdf_path)
-    # Ask viewers to regenerate appearances if needed; this improves display in browser PDF viewers
     try:
-        doc.need_appearances = True
+        doc.need_appearances(True)
+        return
+    except Exception:
+        pass
+    try:
+        doc.xref_set_key(doc.pdf_catalog(), "AcroForm/NeedAppearances", "true")
     except Exception:
         pass
-    # Clear radio parents for this run so we don't mix docs
-    RADIO_PARENTS.clear()
-    RADIO_GROUPS.clear()
-    # Map of explicit defaults provided via placeholders: field_name -> default_value
-    explicit_defaults = {}
+
+def convert_docx_to_fillable_pdf(pdf_path, output_pdf_path, radio_handling=None, scan_workers=None, garbage_level=4, deflate=True):
+    """
+    Processes a PDF file by detecting placeholders like {{textbox:firstname}}
+    and replacing them with PDF form fields that automatically size to table cell dimensions.
+    scan_workers limits the processes used to scan pages for placeholders and tables
+    (default: one per CPU; 1 disables the parallel scan).
+    garbage_level and deflate are passed to doc.save. The default of 4 also merges the
+    duplicate objects left behind by redaction and widget creation, which keeps the
+    output several times smaller than the lower levels.
+    """
+    doc = fitz.open(pdf_path)
     # Track field name usage across the document to make duplicates unique
     field_name_counts = {}
+    # Parent xref of each radio group for this document, keyed by the placeholder's base name
+    # so repeated options share one parent even after their names are made unique
+    radio_parents = {}
+    # Placeholders and tables are found on the untouched source, so all pages can be
+    # scanned up front (in parallel for larger documents)
+    page_scans = scan_placeholders(pdf_path, len(doc), scan_workers)
     
-    for page_num in range(len(doc)):
-        page = doc[page_num]
-        tables = list(page.find_tables(strategy="lines"))
-        detections = list(iter_placeholders(page))
-        print(f"Page {page_num}: Found placeholders: {[ph for ph, _, _ in detections]}")
+    for page_num, page in enumerate(doc):
+        if page_scans is not None:
+            detections, cells = page_scans[page_num]
+        else:
+            detections, cells = _scan_page(page)
+        font_index = build_page_font_index(page) if detections else None
+        cell_grid = _build_cell_grid(cells) if detections else None
+        # Placeholders repeated in the same cell resolve to the same font; look each up once
+        font_cache = {}
+        page_redacts = []
+        log.debug("Page %d: found %d placeholders", page_num, len(detections))
         
         for ph, detection_rect, redact_rects in detections:
             expanded_rect = fitz.Rect(
@@ -1155,44 +1455,31 @@ def convert_docx_to_fillable_pdf(pdf_path, output_pdf_path, radio_handling=None)
                 detection_rect.y1 + 12,
             )
             
-            cell_rect = detection_rect
-            found_in_table = False
-            max_area = 0
-            
-            for table in tables:
-                for row in table.cells:
-                    cell_bbox = fitz.Rect(row[0], row[1], row[2], row[3])
-                    intersection = cell_bbox & expanded_rect
-                    if intersection:
-                        area = intersection.get_area()
-                        if area > max_area:
-                            max_area = area
-                            cell_rect = cell_bbox
-                            found_in_table = True
+            best_cell = _best_cell(cells, expanded_rect, cell_grid)
+            found_in_table = best_cell is not None
+            cell_rect = fitz.Rect(best_cell) if found_in_table else detection_rect
             
             field_type_str, field_name, is_required, is_readonly, options_dict = parse_placeholder(ph)
             
             # Make field names unique by appending page number and occurrence count
             base_field_name = field_name
-            if base_field_name not in field_name_counts:
-                field_name_counts[base_field_name] = 0
-            field_name_counts[base_field_name] += 1
-            occurrence = field_name_counts[base_field_name]
+            occurrence = field_name_counts[base_field_name] = field_name_counts.get(base_field_name, 0) + 1
             # First occurrence keeps original name, subsequent get _P{page}_N{count}
             if occurrence > 1:
                 field_name = f"{base_field_name}_P{page_num}_N{occurrence}"
             
-            if 'default' in options_dict:
-                explicit_defaults[field_name] = options_dict.get('default')
-            
-            if found_in_table and not any(k in options_dict for k in ['rowheight', 'cellwidth', 'columnwidth', 'width', 'height']):
+            if found_in_table and options_dict.keys().isdisjoint(_DIM_KEYS):
                 options_dict['cellwidth'] = str(cell_rect.width)
                 options_dict['rowheight'] = str(cell_rect.height)
             
             field_type = get_field_type(field_type_str)
-            font_name, font_size, text_color = get_font_info(page, cell_rect, ph)
+            font_key = (cell_rect.x0, cell_rect.y0, cell_rect.x1, cell_rect.y1, ph)
+            font_info = font_cache.get(font_key)
+            if font_info is None:
+                font_info = font_cache[font_key] = get_font_info(page, cell_rect, ph, font_index)
+            font_name, font_size, text_color = font_info
             
-            add_form_field(
+            parent_xref = add_form_field(
                 page,
                 cell_rect,
                 field_type,
@@ -1206,52 +1493,23 @@ def convert_docx_to_fillable_pdf(pdf_path, output_pdf_path, radio_handling=None)
                 text_color,
                 found_in_table,
                 radio_handling,
+                radio_parents.get(base_field_name) if field_type == WIDGET_RADIOBUTTON else None,
             )
+            if parent_xref is not None:
+                radio_parents[base_field_name] = parent_xref
             
             # Use precise redact_rects to only remove the placeholder text, not surrounding text
-            for redact_rect in redact_rects:
-                page.add_redact_annot(redact_rect)
+            page_redacts.extend(redact_rects)
         
         if detections:
-            page.apply_redactions(images=fitz.PDF_REDACT_IMAGE_NONE)
+            for redact_rect in _merge_redact_rects(page_redacts):
+                page.add_redact_annot(redact_rect)
+            page.apply_redactions(images=REDACT_IMAGE_NONE)
     
-    # Save the modified PDF
-    # Ensure widget appearances are updated and saved in the PDF
-    try:
-        # Update each widget appearance where possible
-        for p in doc:
-            for w in list(p.widgets()):
-                try:
-                    # For checkboxes and radios, the field_value controls the visual state
-                    if w.field_type in (fitz.PDF_WIDGET_TYPE_CHECKBOX, fitz.PDF_WIDGET_TYPE_RADIOBUTTON):
-                        # If no value is set, attempt to default to the first available on-state
-                        try:
-                            states = list(w.button_states())
-                        except Exception:
-                            states = []
-                        if (not w.field_value or w.field_value in ('Off', None, '')) and states:
-                            # pick a non-Off state if available
-                            for s in states:
-                                if s.lower() not in ('off', 'normal'):
-                                    w.field_value = s
-                                    break
-                        # Enforce explicit defaults
-                        fname = getattr(w, 'field_name', None)
-                        if fname and fname in explicit_defaults:
-                            w.field_value = explicit_defaults[fname]
-                    # For combo/list, ensure a value is set
-                    if w.field_type in (fitz.PDF_WIDGET_TYPE_COMBOBOX, fitz.PDF_WIDGET_TYPE_LISTBOX) and not w.field_value:
-                        vals = getattr(w, 'choice_values', None)
-                        if vals:
-                            w.field_value = vals[0]
-                    w.update()
-                except Exception:
-                    # ignore widget-specific failures but continue
-                    pass
-    except Exception:
-        pass
-
-    doc.save(output_pdf_path, garbage=4, deflate=True)
+    # Ask viewers to regenerate appearances; this improves display in browser PDF viewers
+    _set_need_appearances(doc)
+    # Save the modified PDF; widget states were finalized in add_form_field
+    doc.save(output_pdf_path, garbage=garbage_level, deflate=deflate, deflate_images=deflate)
     doc.close()
 
 
@@ -1261,56 +1519,44 @@ if __name__ == "__main__":
     import argparse
 
     parser = argparse.ArgumentParser(description='Convert DOCX or PDF to a fillable PDF with placeholders.')
-    parser.add_argument('input', nargs='?', help='Path to DOCX or PDF input file')
-    parser.add_argument('-o', '--output', help='Output PDF path (optional). If omitted, saves next to input with _fillable appended')
+    parser.add_argument('input', nargs='*', help='Paths to DOCX or PDF input files')
+    parser.add_argument('-o', '--output', help='Output PDF path (optional, single input only). If omitted, saves next to each input with _fillable appended')
     parser.add_argument('--radio-handling', choices=['fallback', 'skip', 'strict'], default='fallback', help='How to handle radio buttons when PyMuPDF cannot create them (default: fallback -> convert to checkbox)')
     parser.add_argument('--required-border-color', help='Comma-separated RGB values for required field border (0-1 or 0-255), e.g. 1,0,0 or 255,0,0')
     parser.add_argument('--default-border-color', help='Comma-separated RGB values for default field border (0-1 or 0-255), e.g. 0,0.5,1 or 0,128,255')
     parser.add_argument('--required-border-width', type=float, help='Border width (points) for required fields, e.g. 1.0')
     parser.add_argument('--default-border-width', type=float, help='Border width (points) for default fields, e.g. 0.6')
+    parser.add_argument('--scan-workers', type=int, help='Processes used to scan pages for placeholders and tables (default: one per CPU, 1 disables parallel scanning)')
+    parser.add_argument('--garbage-level', type=int, choices=range(5), default=4, help='Garbage collection level used when saving the PDF (default: 4, which also deduplicates objects; 0 skips collection)')
+    parser.add_argument('--debug', action='store_true', help='Log per-field diagnostics (rects, overrides, widget states)')
     args = parser.parse_args()
+    # Library diagnostics go through logging; show warnings and progress notes by default
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if args.debug:
+        # Only this module's logger; third-party libraries stay at INFO
+        log.setLevel(logging.DEBUG)
 
-    input_path = args.input
-    if not input_path:
-        # Use file dialog to select file
+    input_paths = list(args.input)
+    if not input_paths:
+        # Use file dialog to select files
         root = tk.Tk()
         root.withdraw()  # Hide the main window
-        input_path = fd.askopenfilename(
-            title="Select DOCX or PDF file",
+        input_paths = list(fd.askopenfilenames(
+            title="Select DOCX or PDF files",
             filetypes=[("DOCX files", "*.docx"), ("PDF files", "*.pdf"), ("All files", "*.*")]
-        )
-    if not input_path:
+        ))
+    if not input_paths:
         print("No file selected.")
         sys.exit(1)
+    if args.output and len(input_paths) > 1:
+        parser.error('-o/--output can only be used with a single input file')
     
-    if not os.path.exists(input_path):
-        print(f"Error: File not found at {input_path}")
+    missing = [path for path in input_paths if not os.path.exists(path)]
+    for path in missing:
+        print(f"Error: File not found at {path}")
+    if missing:
         sys.exit(1)
-    
-    temp_dir = None
-    if input_path.lower().endswith('.docx'):
-        try:
-            pdf_path, temp_dir = render_docx_to_pdf(input_path)
-            print(f"Converted DOCX to temporary PDF at {pdf_path}")
-        except Exception as exc:
-            print(f"Failed to convert DOCX to PDF: {exc}")
-            sys.exit(1)
-    else:
-        pdf_path = input_path
-    
-    # Process the PDF
-    # If the user passed an explicit output, use it. Otherwise, if the input was a DOCX,
-    # save the output next to the original DOCX (not next to the temporary PDF). For
-    # PDF input, save next to the PDF file.
-    if args.output:
-        output_pdf_path = args.output
-    else:
-        if input_path.lower().endswith('.docx'):
-            # Save next to the DOCX that the user opened
-            output_pdf_path = os.path.splitext(input_path)[0] + '_fillable2.pdf'
-        else:
-            # For PDF input, use the PDF path base
-            output_pdf_path = os.path.splitext(pdf_path)[0] + '_fillable2.pdf'
+
     # Parse and update border options if provided
     def parse_color_arg(arg):
         if not arg:
@@ -1340,10 +1586,60 @@ if __name__ == "__main__":
     if args.default_border_width is not None:
         DEFAULT_BORDER_WIDTH = args.default_border_width
 
-    try:
-        print(f"Processing {pdf_path} -> {output_pdf_path} (radio handling={args.radio_handling})")
-        convert_docx_to_fillable_pdf(pdf_path, output_pdf_path, radio_handling=args.radio_handling)
-        print(f"Output saved to: {output_pdf_path}")
-        print(f"Output saved to: {output_pdf_path}")
-    finally:
-        pass
+    def is_docx(path):
+        return path.lower().endswith('.docx')
+
+    def docx_has_placeholders(docx_path):
+        # Placeholders can be read from the DOCX itself; only pay for the Word/docx2pdf
+        # round-trip when there is something to turn into a form field. An explicit
+        # output path always gets a PDF.
+        try:
+            docx_placeholders = find_docx_placeholders(docx_path)
+        except Exception as exc:
+            print(f"Could not scan {docx_path} for placeholders ({exc}); converting anyway")
+            return True
+        print(f"Found {len(docx_placeholders)} placeholders in {docx_path}")
+        if not docx_placeholders and not args.output:
+            print(f"Nothing to convert for {docx_path}; pass -o to convert anyway.")
+            return False
+        return True
+
+    jobs = [path for path in input_paths if not is_docx(path) or docx_has_placeholders(path)]
+    failures = 0
+    # Two-stage pipeline: while the main thread builds the form for one input, the
+    # renderer thread is already converting the next DOCX to PDF.
+    with ThreadPoolExecutor(max_workers=1) as renderer:
+        def start_render(index):
+            if index < len(jobs) and is_docx(jobs[index]):
+                return renderer.submit(_render_docx_in_thread, jobs[index])
+            return None
+
+        next_render = start_render(0)
+        for index, input_path in enumerate(jobs):
+            rendering, next_render = next_render, start_render(index + 1)
+            temp_dir = None
+            if rendering is None:
+                pdf_path = input_path
+            else:
+                try:
+                    pdf_path, temp_dir = rendering.result()
+                    print(f"Converted DOCX to temporary PDF at {pdf_path}")
+                except Exception as exc:
+                    print(f"Failed to convert {input_path} to PDF: {exc}")
+                    failures += 1
+                    continue
+
+            # Use an explicit output if given; otherwise save next to the file the user
+            # opened (for DOCX input, not next to the temporary PDF).
+            output_pdf_path = args.output or os.path.splitext(input_path)[0] + '_fillable2.pdf'
+            try:
+                print(f"Processing {pdf_path} -> {output_pdf_path} (radio handling={args.radio_handling})")
+                convert_docx_to_fillable_pdf(pdf_path, output_pdf_path, radio_handling=args.radio_handling, scan_workers=args.scan_workers, garbage_level=args.garbage_level)
+                print(f"Output saved to: {output_pdf_path}")
+            except Exception:
+                log.exception("Failed to process %s", input_path)
+                failures += 1
+            finally:
+                if temp_dir:
+                    shutil.rmtree(temp_dir, ignore_errors=True)
+    sys.exit(1 if failures else 0)